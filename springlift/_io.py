@@ -0,0 +1,61 @@
+"""
+Shared File Helpers
+File access and JSON encoding helpers shared by the analyzers, updaters and reports
+"""
+import json
+import mmap
+import os
+import shutil
+from contextlib import contextmanager
+from typing import Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib encoder
+    orjson = None
+
+
+@contextmanager
+def mapped_file(file_path: str):
+    """Yield a read-only memory map of the file (empty bytes for empty files)"""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def write_atomic(path: str, content: Union[str, bytes]) -> None:
+    """
+    Write content to a sibling temp file and swap it into place, keeping the original mode
+    Text is written as UTF-8; bytes are written unchanged
+    """
+    tmp_path = path + '.tmp'
+    try:
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def json_bytes(obj, default=None) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes, using orjson when available
+    
+    default converts values neither encoder supports, as in json.dumps.
+    Returns: the encoded JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=default)
+        except TypeError:  # out-of-range ints, lone surrogates
+            pass
+    return json.dumps(obj, default=default).encode('utf-8', 'surrogatepass')
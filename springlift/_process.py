@@ -0,0 +1,20 @@
+"""
+Worker Process Helpers
+Start method shared by every process pool in the package
+"""
+import multiprocessing
+from multiprocessing.context import BaseContext
+
+
+def worker_context() -> BaseContext:
+    """
+    Start method for worker processes
+    
+    Pools are created from request and batch threads, and forking a
+    multithreaded process can copy locks in a held state into the
+    children, so workers are started by a fork server (spawn where that
+    is unavailable) instead.
+    Returns: the context to pass as a ProcessPoolExecutor's mp_context
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
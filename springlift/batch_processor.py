@@ -1,15 +1,20 @@
 """
 Batch Processing Module
-Allows scanning and processing multiple projects in sequence
+Allows scanning and processing multiple projects concurrently, on a thread
+pool (process_batch) or as bounded asyncio tasks (process_batch_async)
 """
 import os
+import stat
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Optional
 from datetime import datetime
 from .models import ScanRequest, ScanResult
 from .services import genai_service
-from .storage import save_scan_result
+from .storage import save_scan_result, get_scan_result
+from ._io import json_bytes
 from .logger import logger
-import json
 
 
 class BatchProcessor:
@@ -17,12 +22,19 @@ class BatchProcessor:
     Processes multiple Java projects in batch mode
     """
     
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None):
         self.batch_id = None
         self.projects = []
         self.results = []
+        # Finished results by status, kept alongside self.results so status
+        # polls don't rescan it
+        self._counts = {"success": 0, "failed": 0}
         self.start_time = None
         self.end_time = None
+        # Monotonic clock readings for durations; start/end_time stay for display
+        self._t0 = None
+        self._t1 = None
+        self.max_workers = max_workers
     
     def add_project(self, project_path: str, use_ai: bool = True, ai_provider: str = "openai") -> bool:
         """
@@ -31,24 +43,12 @@ class BatchProcessor:
         Returns: True if successfully added
         """
         
-        if not os.path.exists(project_path):
-            logger.error(f"Project path does not exist: {project_path}")
+        abs_path = self._resolve_project_path(project_path)
+        if abs_path is None:
             return False
         
-        if not os.path.isdir(project_path):
-            logger.error(f"Path is not a directory: {project_path}")
-            return False
-        
-        project = {
-            "path": os.path.abspath(project_path),
-            "use_ai": use_ai,
-            "ai_provider": ai_provider,
-            "status": "pending",
-            "result": None
-        }
-        
-        self.projects.append(project)
-        logger.info(f"Added project to batch: {project_path}")
+        self._enqueue_project(abs_path, use_ai, ai_provider)
+        logger.info("Added project to batch: %s", project_path)
         return True
     
     def add_projects_from_list(self, project_paths: List[str], use_ai: bool = True, ai_provider: str = "openai") -> int:
@@ -60,13 +60,54 @@ class BatchProcessor:
         
         added = 0
         
-        for path in project_paths:
-            if self.add_project(path, use_ai, ai_provider):
-                added += 1
+        if project_paths:
+            # Path checks are pure filesystem I/O, so stat all paths concurrently;
+            # map() keeps the results in input order for deterministic queueing
+            max_workers = min(32, len(project_paths))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                resolved = list(executor.map(self._resolve_project_path, project_paths))
+            
+            for path, abs_path in zip(project_paths, resolved):
+                if abs_path is not None:
+                    self._enqueue_project(abs_path, use_ai, ai_provider)
+                    logger.info("Added project to batch: %s", path)
+                    added += 1
         
         logger.info(f"Added {added} projects to batch queue")
         return added
     
+    @staticmethod
+    def _resolve_project_path(project_path: str) -> Optional[str]:
+        """
+        Check that project_path is an existing directory with a single stat call
+        
+        Returns: Absolute project path, or None if it cannot be queued
+        """
+        
+        try:
+            st = os.stat(project_path)
+        except (OSError, ValueError):
+            logger.error("Project path does not exist: %s", project_path)
+            return None
+        
+        if not stat.S_ISDIR(st.st_mode):
+            logger.error("Path is not a directory: %s", project_path)
+            return None
+        
+        return os.path.abspath(project_path)
+    
+    def _enqueue_project(self, abs_path: str, use_ai: bool, ai_provider: str) -> None:
+        """Append a validated project to the batch queue"""
+        
+        self.projects.append({
+            "path": abs_path,
+            "use_ai": use_ai,
+            "ai_provider": ai_provider,
+            "status": "pending",
+            "scan_id": None,
+            "output_path": None
+        })
+    
     def process_batch(self) -> Dict:
         """
         Process all projects in the batch
@@ -79,58 +120,57 @@ class BatchProcessor:
             return {"status": "empty", "message": "No projects to process"}
         
         self.start_time = datetime.now()
-        successful = 0
-        failed = 0
+        self._t0 = time.perf_counter_ns()
+        total = len(self.projects)
         
-        logger.info(f"Starting batch processing of {len(self.projects)} projects")
+        logger.info(f"Starting batch processing of {total} projects")
         
-        for idx, project in enumerate(self.projects, 1):
-            project_path = project["path"]
-            project_name = os.path.basename(project_path)
-            
-            logger.info(f"[{idx}/{len(self.projects)}] Processing: {project_name}")
-            
-            try:
-                # Create scan request
-                request = ScanRequest(
-                    project_path=project_path,
-                    use_ai=project["use_ai"],
-                    ai_provider=project["ai_provider"]
-                )
-                
-                # Analyze code
-                result = genai_service.analyze_code(request)
-                
-                # Save result
-                save_scan_result(result)
-                
-                # Update project status
-                project["status"] = "completed"
-                project["result"] = result
-                self.results.append({
-                    "project": project_name,
-                    "scan_id": result.id,
-                    "output_path": result.output_path,
-                    "status": "success"
-                })
-                
-                successful += 1
-                logger.info(f"✓ Successfully processed: {project_name}")
+        # Each project is dominated by file I/O and GenAI network latency,
+        # so a bounded thread pool overlaps them well
+        max_workers = self.max_workers or min(total, (os.cpu_count() or 4) * 2)
+        
+        # One slot per project, filled by index as projects finish
+        self._reset_results(total)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._process_one, idx, total, project): idx
+                for idx, project in enumerate(self.projects, 1)
+            }
             
-            except Exception as e:
-                project["status"] = "failed"
-                project["error"] = str(e)
-                self.results.append({
-                    "project": project_name,
-                    "status": "failed",
-                    "error": str(e)
-                })
-                
-                failed += 1
-                logger.error(f"✗ Failed to process {project_name}: {str(e)}")
+            for future in as_completed(futures):
+                self._record_result(futures[future], future.result())
+        
+        return self._build_report()
+    
+    def _reset_results(self, total: int) -> None:
+        """Pre-size self.results to the batch and zero the status counters"""
+        
+        self.results = [None] * total
+        self._counts = {"success": 0, "failed": 0}
+    
+    def _record_result(self, idx: int, entry: Dict) -> None:
+        """Store the result entry of the idx-th (1-based) project and count it"""
+        
+        self.results[idx - 1] = entry
+        self._counts[entry["status"]] += 1
+    
+    @property
+    def completed_count(self) -> int:
+        """Number of projects that have finished processing, without scanning results"""
+        
+        return self._counts["success"] + self._counts["failed"]
+    
+    def _build_report(self) -> Dict:
+        """
+        Finalize timing and assemble the batch processing report
+        """
         
         self.end_time = datetime.now()
-        duration = (self.end_time - self.start_time).total_seconds()
+        self._t1 = time.perf_counter_ns()
+        duration = self._elapsed_seconds()
+        successful = self._counts["success"]
+        failed = self._counts["failed"]
         
         report = {
             "status": "completed",
@@ -140,16 +180,92 @@ class BatchProcessor:
             "duration_seconds": round(duration, 2),
             "start_time": self.start_time.isoformat(),
             "end_time": self.end_time.isoformat(),
-            "results": self.results
+            "results": self.completed_results()
         }
         
         logger.info(f"Batch processing complete: {successful} succeeded, {failed} failed")
         
         return report
     
-    def process_batch_async(self, callback=None) -> str:
+    def _elapsed_seconds(self) -> Optional[float]:
+        """Batch duration from the monotonic clock, or None if not finished"""
+        
+        if self._t0 is None or self._t1 is None:
+            return None
+        return (self._t1 - self._t0) / 1e9
+    
+    def get_result(self, project: Dict) -> Optional[ScanResult]:
+        """
+        Look up the stored ScanResult for a processed project
+        """
+        
+        scan_id = project.get("scan_id")
+        return get_scan_result(scan_id) if scan_id else None
+    
+    def _process_one(self, idx: int, total: int, project: Dict) -> Dict:
+        """
+        Scan a single batch project
+        
+        Returns: Result entry for self.results
         """
-        Process batch asynchronously with callback
+        
+        project_path = project["path"]
+        project_name = os.path.basename(project_path)
+        
+        # Per-project logging uses %-style arguments so messages are only
+        # formatted when the level is enabled
+        logger.info("[%d/%d] Processing: %s", idx, total, project_name)
+        started = time.perf_counter_ns()
+        
+        try:
+            # Create scan request
+            request = ScanRequest(
+                project_path=project_path,
+                use_ai=project["use_ai"],
+                ai_provider=project["ai_provider"]
+            )
+            
+            # Analyze code
+            result = genai_service.analyze_code(request)
+            
+            # Save result
+            save_scan_result(result)
+            
+            # Update project status; keep only the ID so the full ScanResult
+            # is not pinned in memory for the lifetime of the batch
+            project["status"] = "completed"
+            project["scan_id"] = result.id
+            project["output_path"] = result.output_path
+            
+            elapsed = (time.perf_counter_ns() - started) / 1e9
+            logger.info("✓ Successfully processed: %s in %.2fs", project_name, elapsed)
+            return {
+                "project": project_name,
+                "scan_id": result.id,
+                "output_path": result.output_path,
+                "status": "success"
+            }
+        
+        except Exception as e:
+            project["status"] = "failed"
+            project["error"] = str(e)
+            
+            elapsed = (time.perf_counter_ns() - started) / 1e9
+            logger.error("✗ Failed to process %s after %.2fs: %s", project_name, elapsed, e)
+            return {
+                "project": project_name,
+                "status": "failed",
+                "error": str(e)
+            }
+    
+    def process_batch_async(self, callback=None, concurrency: Optional[int] = None) -> str:
+        """
+        Process batch on an asyncio event loop with callback
+        
+        The callback is invoked with each project's result entry as soon as
+        that project finishes, and once more with the final batch report.
+        Called from inside a running event loop, the batch gets its own loop
+        on a helper thread, so this works from any context.
         
         Returns: Batch ID for tracking
         """
@@ -159,10 +275,20 @@ class BatchProcessor:
         
         logger.info(f"Starting async batch processing with ID: {self.batch_id}")
         
-        # In a real application, this would be done with async/queue system
-        # For now, we'll do synchronous processing
+        if not self.projects:
+            logger.warning("No projects in batch queue")
+            report = {"status": "empty", "message": "No projects to process"}
+        else:
+            coroutine = self._run(callback, concurrency)
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                report = asyncio.run(coroutine)
+            else:
+                # Already inside an event loop: run ours on a helper thread
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    report = executor.submit(asyncio.run, coroutine).result()
         
-        report = self.process_batch()
         report["batch_id"] = self.batch_id
         
         if callback:
@@ -170,26 +296,68 @@ class BatchProcessor:
         
         return self.batch_id
     
+    async def _run(self, callback=None, concurrency: Optional[int] = None) -> Dict:
+        """
+        Run all queued projects with a bounded number of in-flight scans
+        
+        Returns: Batch processing report
+        """
+        
+        self.start_time = datetime.now()
+        self._t0 = time.perf_counter_ns()
+        total = len(self.projects)
+        concurrency = concurrency or self.max_workers or min(total, (os.cpu_count() or 4) * 2)
+        
+        logger.info(f"Starting batch processing of {total} projects")
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        self._reset_results(total)
+        
+        async def run_one(idx: int, project: Dict):
+            # Blocking scan and SDK calls run off the event loop
+            async with semaphore:
+                entry = await asyncio.to_thread(self._process_one, idx, total, project)
+            
+            self._record_result(idx, entry)
+            
+            if callback:
+                callback(entry)
+        
+        await asyncio.gather(*(run_one(idx, project) for idx, project in enumerate(self.projects, 1)))
+        
+        return self._build_report()
+    
+    def completed_results(self) -> List[Dict]:
+        """
+        Result entries for projects that have finished processing
+        
+        self.results is pre-sized to the batch, so unfinished slots are None
+        """
+        
+        return [r for r in self.results if r is not None]
+    
     def get_batch_summary(self) -> Dict:
         """
         Get summary of batch processing results
         """
         
-        if not self.results:
+        processed = self.completed_count
+        
+        if not processed:
             return {"status": "pending", "projects_processed": 0}
         
-        successful = sum(1 for r in self.results if r.get("status") == "success")
-        failed = sum(1 for r in self.results if r.get("status") == "failed")
+        successful = self._counts["success"]
+        failed = self._counts["failed"]
         
         return {
             "batch_id": self.batch_id,
-            "total_projects": len(self.results),
+            "total_projects": processed,
             "successful": successful,
             "failed": failed,
-            "success_rate": round(successful / max(1, len(self.results)) * 100, 2),
+            "success_rate": round(successful / max(1, processed) * 100, 2),
             "start_time": self.start_time.isoformat() if self.start_time else None,
             "end_time": self.end_time.isoformat() if self.end_time else None,
-            "duration_seconds": (self.end_time - self.start_time).total_seconds() if self.start_time and self.end_time else None
+            "duration_seconds": self._elapsed_seconds()
         }
     
     def export_batch_report(self, output_path: str) -> bool:
@@ -198,14 +366,16 @@ class BatchProcessor:
         """
         
         try:
-            report = {
-                "batch_summary": self.get_batch_summary(),
-                "results": self.results,
-                "projects": self.projects
-            }
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2)
+            # Stream the report piece by piece rather than materializing
+            # one large dict/string for big batches
+            with open(output_path, 'wb') as f:
+                f.write(b'{"batch_summary": ')
+                f.write(json_bytes(self.get_batch_summary()))
+                f.write(b', "results": ')
+                self._dump_json_array(self.completed_results(), f)
+                f.write(b', "projects": ')
+                self._dump_json_array(self.projects, f)
+                f.write(b'}\n')
             
             logger.info(f"Batch report exported to {output_path}")
             return True
@@ -214,14 +384,29 @@ class BatchProcessor:
             logger.error(f"Failed to export batch report: {str(e)}")
             return False
     
+    @staticmethod
+    def _dump_json_array(items: List[Dict], f) -> None:
+        """Write items to binary file f as a JSON array, one element at a time"""
+        
+        f.write(b'[')
+        first = True
+        for item in items:
+            if not first:
+                f.write(b', ')
+            f.write(json_bytes(item))
+            first = False
+        f.write(b']')
+    
     def clear(self):
         """Clear batch data for next processing"""
         
         self.batch_id = None
         self.projects = []
-        self.results = []
+        self._reset_results(0)
         self.start_time = None
         self.end_time = None
+        self._t0 = None
+        self._t1 = None
         logger.info("Batch processor cleared")
 
 
@@ -2,11 +2,101 @@
 Configuration File Analyzer
 Analyzes Spring Boot configuration files for modernization
 """
+import copy
+import io
 import os
 import re
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import xml.etree.ElementTree as ET
+from typing import Dict, Iterator, List, Optional, Tuple
+import yaml
+from ._io import mapped_file
 from .logger import logger
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Patterns compiled once at import rather than on every analyzer call
+_SOURCE_COMPAT_RE = re.compile(r"sourceCompatibility\s*=\s*['\"]([^'\"]+)['\"]")
+_TARGET_COMPAT_RE = re.compile(r"targetCompatibility\s*=\s*['\"]([^'\"]+)['\"]")
+_SPRING_GRADLE_RE = re.compile(r"'org\.springframework\.boot:spring-boot-gradle-plugin:([^'\"]+)'")
+_POM_PROPS_RE = re.compile(r'<properties>(.*?)</properties>', re.DOTALL)
+_POM_INNER_RE = re.compile(r'<(\w+)>([^<]+)</\1>')
+
+# Byte twins of the Gradle patterns, for searching memory-mapped files directly
+_BYTE_PATTERNS = {
+    pattern: re.compile(pattern.pattern.encode(), pattern.flags & ~re.UNICODE)
+    for pattern in (_SOURCE_COMPAT_RE, _TARGET_COMPAT_RE, _SPRING_GRADLE_RE)
+}
+
+# One "key = value" property per match; blank and comment lines never match
+_PROP_LINE_RE = re.compile(r'^[ \t]*([^#=\s][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$', re.MULTILINE)
+
+# Java versions that should be upgraded to 21
+_LEGACY_JAVA = frozenset({'1.8', '8', '11'})
+
+
+def _build_property_rules(deprecated: Dict[str, str], migrations: Dict[str, str]) -> Dict[str, Tuple]:
+    """
+    Merge the rule tables into key -> (issue template, recommendation template, migration target)
+    
+    Messages are formatted once here; a matching line only copies its template.
+    """
+    rules = {}
+    for key in deprecated.keys() | migrations.keys():
+        issue = None
+        if key in deprecated:
+            issue = {
+                "line": None,
+                "property": key,
+                "severity": "warning",
+                "message": f"Property '{key}' is deprecated in Spring Boot 3.x",
+                "suggestion": deprecated[key]
+            }
+        
+        recommendation = None
+        new_key = migrations.get(key)
+        if new_key is not None and new_key != key:
+            recommendation = {
+                "property": key,
+                "new_property": new_key,
+                "current_value": None,
+                "suggestion": f"Migrate property from '{key}' to '{new_key}'"
+            }
+        else:
+            new_key = None
+        
+        rules[key] = (issue, recommendation, new_key)
+    return rules
+
+
+# File names already reported as unknown, so large batches warn once per name
+_warned_file_types = set()
+
+
+def _warn_unknown_file_type(filename: str) -> None:
+    """Log an unknown configuration file type the first time it is seen"""
+    if filename not in _warned_file_types:
+        _warned_file_types.add(filename)
+        logger.warning("Unknown configuration file type: %s", filename)
+
+
+def _search_group(pattern: re.Pattern, content) -> Optional[str]:
+    """Return the first match's group 1 as text; content may be str or a bytes-like buffer"""
+    if not isinstance(content, str):
+        pattern = _BYTE_PATTERNS[pattern]
+    
+    match = pattern.search(content)
+    if not match:
+        return None
+    
+    value = match.group(1)
+    return value if isinstance(value, str) else value.decode('utf-8', errors='replace')
+
 
 class ConfigurationAnalyzer:
     """
@@ -45,59 +135,36 @@ class ConfigurationAnalyzer:
             "Consider using spring.datasource.hikari.pool-name",
     }
     
+    # Single lookup table over both rule sets, so each key is hashed once
+    PROPERTY_RULES = _build_property_rules(DEPRECATED_PROPERTIES, PROPERTY_MIGRATIONS)
+    
+    # Leading segments of all rule keys (e.g. "spring.", "logging."); lets
+    # application-owned keys skip the rule lookup with one startswith call
+    RULE_PREFIXES = tuple(sorted({key.split('.', 1)[0] + '.' for key in PROPERTY_RULES}))
+    
     @staticmethod
-    def analyze_application_properties(content: str) -> Dict:
+    def analyze_application_properties(content) -> Dict:
         """
         Analyze application.properties file
+        
+        content may be the file text or an iterable of lines such as an open
+        text file, which is consumed lazily one line at a time
         """
         issues = []
         recommendations = []
         migrations = {}
         
-        lines = content.split('\n')
-        
-        for line_num, line in enumerate(lines, 1):
-            # Skip comments and empty lines
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
+        for line_num, key, value in ConfigurationAnalyzer._iter_properties(content):
+            ConfigurationAnalyzer._apply_property_rules(key, value, line_num, issues, recommendations, migrations)
             
-            # Parse property
-            if '=' in line:
-                key, value = line.split('=', 1)
-                key = key.strip()
-                value = value.strip()
-                
-                # Check for deprecated properties
-                if key in ConfigurationAnalyzer.DEPRECATED_PROPERTIES:
-                    issues.append({
-                        "line": line_num,
+            # Check for Java version in properties
+            if "java.version" in key or "source.encoding" in key:
+                if not value or value in _LEGACY_JAVA:
+                    recommendations.append({
                         "property": key,
-                        "severity": "warning",
-                        "message": f"Property '{key}' is deprecated in Spring Boot 3.x",
-                        "suggestion": ConfigurationAnalyzer.DEPRECATED_PROPERTIES[key]
+                        "current_value": value,
+                        "suggestion": f"Update Java version to 21"
                     })
-                
-                # Check for property migrations
-                if key in ConfigurationAnalyzer.PROPERTY_MIGRATIONS:
-                    new_key = ConfigurationAnalyzer.PROPERTY_MIGRATIONS[key]
-                    if key != new_key:
-                        migrations[key] = new_key
-                        recommendations.append({
-                            "property": key,
-                            "new_property": new_key,
-                            "current_value": value,
-                            "suggestion": f"Migrate property from '{key}' to '{new_key}'"
-                        })
-                
-                # Check for Java version in properties
-                if "java.version" in key or "source.encoding" in key:
-                    if not value or value == "1.8" or value == "8" or value == "11":
-                        recommendations.append({
-                            "property": key,
-                            "current_value": value,
-                            "suggestion": f"Update Java version to 21"
-                        })
         
         return {
             "file_type": "properties",
@@ -106,6 +173,27 @@ class ConfigurationAnalyzer:
             "recommendations": recommendations
         }
     
+    @staticmethod
+    def _iter_properties(content) -> Iterator[Tuple[int, str, str]]:
+        """
+        Yield (line number, key, value) for each property assignment
+        """
+        if isinstance(content, str):
+            line_num = 1
+            last_pos = 0
+            
+            for match in _PROP_LINE_RE.finditer(content):
+                # Advance the line counter to this match without splitting the content
+                line_num += content.count('\n', last_pos, match.start())
+                last_pos = match.start()
+                yield line_num, match.group(1), match.group(2)
+            return
+        
+        for line_num, line in enumerate(content, 1):
+            match = _PROP_LINE_RE.match(line)
+            if match:
+                yield line_num, match.group(1), match.group(2)
+    
     @staticmethod
     def analyze_application_yaml(content: str) -> Dict:
         """
@@ -115,28 +203,19 @@ class ConfigurationAnalyzer:
         recommendations = []
         migrations = {}
         
-        lines = content.split('\n')
+        try:
+            documents = list(yaml.compose_all(content, Loader=_YamlLoader))
+        except yaml.YAMLError as e:
+            issues.append({
+                "severity": "error",
+                "message": f"Invalid YAML: {str(e)}",
+                "suggestion": "Fix the YAML syntax before migrating"
+            })
+            documents = []
         
-        for line_num, line in enumerate(lines, 1):
-            # Skip comments and empty lines
-            stripped = line.strip()
-            if not stripped or stripped.startswith('#'):
-                continue
-            
-            # Parse YAML key-value pairs (simple parsing for common patterns)
-            if ':' in stripped and not stripped.startswith('-'):
-                key_part = stripped.split(':')[0].strip()
-                
-                # Check for deprecated or migration-needed keys
-                for prop_key in ConfigurationAnalyzer.DEPRECATED_PROPERTIES:
-                    if key_part.endswith(prop_key.split('.')[-1]):
-                        issues.append({
-                            "line": line_num,
-                            "content": stripped,
-                            "severity": "warning",
-                            "message": f"Potentially deprecated property: {key_part}",
-                            "suggestion": ConfigurationAnalyzer.DEPRECATED_PROPERTIES.get(prop_key, "")
-                        })
+        for document in documents:
+            for key, value, line_num in ConfigurationAnalyzer._flatten_yaml(document):
+                ConfigurationAnalyzer._apply_property_rules(key, value, line_num, issues, recommendations, migrations)
         
         return {
             "file_type": "yaml",
@@ -146,44 +225,80 @@ class ConfigurationAnalyzer:
         }
     
     @staticmethod
-    def analyze_pom_xml_properties(content: str) -> Dict:
+    def _apply_property_rules(key: str, value: str, line_num: int, issues: List, recommendations: List, migrations: Dict) -> None:
+        """
+        Record deprecation issues and migration recommendations for one property
+        """
+        if not key.startswith(ConfigurationAnalyzer.RULE_PREFIXES):
+            return
+        
+        rule = ConfigurationAnalyzer.PROPERTY_RULES.get(key)
+        if rule is None:
+            return
+        
+        issue_template, recommendation_template, new_key = rule
+        
+        # Check for deprecated properties
+        if issue_template is not None:
+            issue = issue_template.copy()
+            issue["line"] = line_num
+            issues.append(issue)
+        
+        # Check for property migrations
+        if new_key is not None:
+            migrations[key] = new_key
+            recommendation = recommendation_template.copy()
+            recommendation["current_value"] = value
+            recommendations.append(recommendation)
+    
+    @staticmethod
+    def _flatten_yaml(node, prefix: str = "") -> Iterator[Tuple[str, str, int]]:
+        """
+        Yield (dotted.key, value, line) for every scalar leaf of a composed YAML node
+        """
+        if not isinstance(node, yaml.MappingNode):
+            return
+        
+        for key_node, value_node in node.value:
+            key = f"{prefix}{key_node.value}"
+            if isinstance(value_node, yaml.MappingNode):
+                yield from ConfigurationAnalyzer._flatten_yaml(value_node, f"{key}.")
+            elif isinstance(value_node, yaml.ScalarNode):
+                yield key, value_node.value, key_node.start_mark.line + 1
+    
+    @staticmethod
+    def analyze_pom_xml_properties(content) -> Dict:
         """
         Extract and analyze properties from pom.xml
+        
+        content may be the pom text or a readable bytes buffer (e.g. an mmap)
         """
         issues = []
         recommendations = []
         properties = {}
         
-        # Extract properties section
-        properties_match = re.search(r'<properties>(.*?)</properties>', content, re.DOTALL)
-        if properties_match:
-            properties_content = properties_match.group(1)
+        for prop_name, prop_value in ConfigurationAnalyzer._extract_pom_properties(content):
+            properties[prop_name] = prop_value
             
-            # Extract individual properties
-            prop_matches = re.findall(r'<(\w+)>([^<]+)</\1>', properties_content)
+            # Check Java version
+            if 'java' in prop_name.lower() and 'version' in prop_name.lower():
+                if prop_value in _LEGACY_JAVA:
+                    recommendations.append({
+                        "property": prop_name,
+                        "current_value": prop_value,
+                        "suggested_value": "21",
+                        "message": f"Update Java version from {prop_value} to 21"
+                    })
             
-            for prop_name, prop_value in prop_matches:
-                properties[prop_name] = prop_value
-                
-                # Check Java version
-                if 'java' in prop_name.lower() and 'version' in prop_name.lower():
-                    if prop_value in ['1.8', '8', '11']:
-                        recommendations.append({
-                            "property": prop_name,
-                            "current_value": prop_value,
-                            "suggested_value": "21",
-                            "message": f"Update Java version from {prop_value} to 21"
-                        })
-                
-                # Check Spring Boot version
-                if 'spring.boot' in prop_name.lower():
-                    if prop_value.startswith('2.'):
-                        recommendations.append({
-                            "property": prop_name,
-                            "current_value": prop_value,
-                            "suggested_value": "3.0.0+",
-                            "message": f"Update Spring Boot from {prop_value} to 3.x"
-                        })
+            # Check Spring Boot version
+            if 'spring.boot' in prop_name.lower():
+                if prop_value.startswith('2.'):
+                    recommendations.append({
+                        "property": prop_name,
+                        "current_value": prop_value,
+                        "suggested_value": "3.0.0+",
+                        "message": f"Update Spring Boot from {prop_value} to 3.x"
+                    })
         
         return {
             "file_type": "pom.xml",
@@ -193,21 +308,62 @@ class ConfigurationAnalyzer:
         }
     
     @staticmethod
-    def analyze_gradle_properties(content: str) -> Dict:
+    def _extract_pom_properties(content) -> List[Tuple[str, str]]:
+        """
+        Collect (name, value) pairs from every <properties> section of a pom
+        
+        Streams the document with iterparse and clears elements as they close,
+        matching tags by local name so namespaced and plain poms both work.
+        Falls back to regex scraping when the XML is malformed.
+        """
+        pairs = []
+        depth = 0  # 0 = outside <properties>, 1 = on it, 2 = on a property
+        
+        try:
+            if isinstance(content, str):
+                source = io.StringIO(content)
+            elif isinstance(content, bytes):
+                source = io.BytesIO(content)
+            else:
+                source = content
+            for event, elem in ET.iterparse(source, events=('start', 'end')):
+                if event == 'start':
+                    if depth:
+                        depth += 1
+                    elif elem.tag.rpartition('}')[2] == 'properties':
+                        depth = 1
+                    continue
+                
+                if depth == 2 and elem.text and elem.text.strip():
+                    pairs.append((elem.tag.rpartition('}')[2], elem.text.strip()))
+                if depth:
+                    depth -= 1
+                elem.clear()
+        except ET.ParseError:
+            if not isinstance(content, str):
+                content = content[:].decode('utf-8', errors='ignore')
+            properties_match = _POM_PROPS_RE.search(content)
+            pairs = _POM_INNER_RE.findall(properties_match.group(1)) if properties_match else []
+        
+        return pairs
+    
+    @staticmethod
+    def analyze_gradle_properties(content) -> Dict:
         """
         Analyze build.gradle for configuration needs
+        
+        content may be the build script text or a bytes-like buffer (e.g. an mmap)
         """
         issues = []
         recommendations = []
         config = {}
         
         # Extract Java version
-        java_version_match = re.search(r"sourceCompatibility\s*=\s*['\"]([^'\"]+)['\"]", content)
-        if java_version_match:
-            java_version = java_version_match.group(1)
+        java_version = _search_group(_SOURCE_COMPAT_RE, content)
+        if java_version:
             config['sourceCompatibility'] = java_version
             
-            if java_version in ['1.8', '8', '11']:
+            if java_version in _LEGACY_JAVA:
                 recommendations.append({
                     "property": "sourceCompatibility",
                     "current_value": java_version,
@@ -216,12 +372,11 @@ class ConfigurationAnalyzer:
                 })
         
         # Extract targetCompatibility
-        target_version_match = re.search(r"targetCompatibility\s*=\s*['\"]([^'\"]+)['\"]", content)
-        if target_version_match:
-            target_version = target_version_match.group(1)
+        target_version = _search_group(_TARGET_COMPAT_RE, content)
+        if target_version:
             config['targetCompatibility'] = target_version
             
-            if target_version in ['1.8', '8', '11']:
+            if target_version in _LEGACY_JAVA:
                 recommendations.append({
                     "property": "targetCompatibility",
                     "current_value": target_version,
@@ -230,9 +385,8 @@ class ConfigurationAnalyzer:
                 })
         
         # Check Spring Boot version in dependencies
-        spring_boot_match = re.search(r"'org\.springframework\.boot:spring-boot-gradle-plugin:([^'\"]+)'", content)
-        if spring_boot_match:
-            version = spring_boot_match.group(1)
+        version = _search_group(_SPRING_GRADLE_RE, content)
+        if version:
             config['spring_boot_version'] = version
             
             if version.startswith('2.'):
@@ -254,32 +408,74 @@ class ConfigurationAnalyzer:
     def analyze_config_file(file_path: str) -> Optional[Dict]:
         """
         Analyze a configuration file and return results
+        
+        Results are cached per (path, mtime, size), so unchanged files shared
+        across modules or repeated batch runs are only parsed once. Each call
+        gets its own copy, so callers may mutate it. Failures are not cached,
+        so a file that becomes readable is analyzed on the next call.
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            filename = os.path.basename(file_path)
-            
+            st = os.stat(file_path)
+            result = ConfigurationAnalyzer._analyze_config_file_cached(file_path, st.st_mtime_ns, st.st_size)
+        except Exception as e:
+            logger.error("Error analyzing config file %s: %s", file_path, e)
+            return None
+        
+        # The cached dict must stay intact
+        return copy.deepcopy(result)
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _analyze_config_file_cached(file_path: str, mtime_ns: int, size: int) -> Optional[Dict]:
+        """
+        Cache wrapper; mtime_ns and size only participate in the cache key
+        Errors propagate, and lru_cache does not store them
+        """
+        return ConfigurationAnalyzer._analyze_config_file_uncached(file_path)
+    
+    @staticmethod
+    def _analyze_config_file_uncached(file_path: str) -> Optional[Dict]:
+        """
+        Read and analyze a configuration file
+        
+        Raises whatever reading or parsing the file raises.
+        Returns: the analysis, or None for unknown file types
+        """
+        filename = os.path.basename(file_path)
+        
+        # Build files are usually only sampled in a few places, so scan
+        # them through a memory map instead of decoding the whole file
+        if filename in ('pom.xml', 'build.gradle'):
+            with mapped_file(file_path) as mapped:
+                if filename == 'pom.xml':
+                    return ConfigurationAnalyzer.analyze_pom_xml_properties(mapped)
+                return ConfigurationAnalyzer.analyze_gradle_properties(mapped)
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
             if filename == 'application.properties':
-                return ConfigurationAnalyzer.analyze_application_properties(content)
+                # Stream line by line instead of reading the whole file
+                return ConfigurationAnalyzer.analyze_application_properties(f)
             
             elif filename in ['application.yml', 'application.yaml']:
-                return ConfigurationAnalyzer.analyze_application_yaml(content)
-            
-            elif filename == 'pom.xml':
-                return ConfigurationAnalyzer.analyze_pom_xml_properties(content)
-            
-            elif filename == 'build.gradle':
-                return ConfigurationAnalyzer.analyze_gradle_properties(content)
+                return ConfigurationAnalyzer.analyze_application_yaml(f.read())
             
             else:
-                logger.warning(f"Unknown configuration file type: {filename}")
+                _warn_unknown_file_type(filename)
                 return None
+    
+    @staticmethod
+    def analyze_config_files(paths: List[str], max_workers: Optional[int] = None) -> List[Optional[Dict]]:
+        """
+        Analyze many configuration files concurrently
         
-        except Exception as e:
-            logger.error(f"Error analyzing config file {file_path}: {str(e)}")
-            return None
+        Returns: Results aligned with paths (None for files that could not be analyzed)
+        """
+        if not paths:
+            return []
+        
+        max_workers = max_workers or min(32, len(paths), (os.cpu_count() or 4) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(ConfigurationAnalyzer.analyze_config_file, paths))
 
 
 # Singleton instance
@@ -2,10 +2,86 @@
 Diff Report Generator
 Creates detailed before/after code comparison reports
 """
+import copy
 import difflib
-from typing import Dict, List, Tuple
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import accumulate
+from typing import Dict, List, Optional, Sequence, Tuple
+from ._io import json_bytes
+from ._process import worker_context
 from .logger import logger
-import json
+
+try:
+    from rapidfuzz.distance import Indel
+except ImportError:  # optional speedup; fall back to _lcs_similarity
+    Indel = None
+
+
+def _lcs_length(a: Sequence, b: Sequence) -> int:
+    """
+    Length of the longest common subsequence via the bit-parallel recurrence (Hyyro 2004)
+    
+    Python ints act as arbitrary-width bit vectors, so each element of b
+    costs a handful of word-parallel big-int operations over len(a) bits
+    instead of a row of a Python-level DP table. Works on strings as well
+    as on lists of lines (any hashable elements), in linear space.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return 0
+    
+    # Bit i of masks[x] is set where a[i] == x
+    masks = {}
+    bit = 1
+    for x in a:
+        masks[x] = masks.get(x, 0) | bit
+        bit <<= 1
+    
+    full = bit - 1
+    v = full
+    get = masks.get
+    for x in b:
+        u = v & get(x, 0)
+        v = ((v + u) | (v - u)) & full
+    
+    # Each zero bit left in v is one matched element of the LCS
+    return len(a) - bin(v).count('1')
+
+
+def _lcs_similarity(a: str, b: str) -> float:
+    """2*LCS/(len(a)+len(b)); same result as rapidfuzz's Indel.normalized_similarity"""
+    if not a and not b:
+        return 1.0
+    return 2 * _lcs_length(a, b) / (len(a) + len(b))
+
+
+# Line boundaries str.splitlines() honours besides \n, \r and \r\n; text that
+# contains any of them is counted with splitlines() itself
+_RARE_LINE_BREAKS_RE = re.compile(r'[\v\f\x1c\x1d\x1e\x85\u2028\u2029]')
+
+# Substrings _categorize_change keys on; none can overlap another, so
+# findall reports exactly the markers a plain `in` test would find
+_CHANGE_MARKERS_RE = re.compile(r"javax\.|jakarta\.|import|//|Deprecated")
+
+# Cell styling lives in one <style> block; rows only carry a short class
+# name per cell (e = unchanged, d = removed, a = added, ro/rm = replaced)
+_TABLE_HEADER = (
+    '<style>'
+    '.sl-diff{width:100%;border-collapse:collapse;font-family:monospace}'
+    '.sl-diff th{width:50%;padding:10px;border:1px solid #ddd;background:#f0f0f0}'
+    '.sl-diff td{padding:5px;border:1px solid #ddd}'
+    '.sl-diff .e{background:#fff}.sl-diff .d{background:#ffcccc}.sl-diff .a{background:#ccffcc}'
+    '.sl-diff .ro{background:#ffeecc}.sl-diff .rm{background:#eeffcc}'
+    '</style>\n'
+    '<table class="sl-diff"><tr><th>Original</th><th>Modernized</th></tr>\n'
+)
+
+# {0}/{2} are cell class names, {1}/{3} the escaped lines
+_ROW_TEMPLATE = '<tr><td class="{0}">{1}</td><td class="{2}">{3}</td></tr>\n'
 
 
 class DiffReportGenerator:
@@ -13,37 +89,137 @@ class DiffReportGenerator:
     Generates detailed diff reports showing code changes during modernization
     """
     
+    HTML_ESCAPE_TABLE = str.maketrans({
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "'": "&#39;",
+    })
+    
     @staticmethod
-    def generate_file_diff(original_content: str, modernized_content: str, filename: str) -> Dict:
+    def generate_file_diff(original_content: str, modernized_content: str, filename: str,
+                           include_diff: bool = True) -> Dict:
         """
         Generate a detailed diff between original and modernized code
         
+        Stats-only callers can pass include_diff=False to skip rendering the
+        unified diff text; "unified_diff" is then an empty string.
+        
         Returns: Dict with diff statistics and details
         """
         
+        # Most files come through modernization unchanged; skip difflib entirely
+        if original_content == modernized_content:
+            line_count = DiffReportGenerator._count_lines(original_content)
+            return {
+                "filename": filename,
+                "original_lines": line_count,
+                "modernized_lines": line_count,
+                "added_lines": 0,
+                "removed_lines": 0,
+                "changed_lines": 0,
+                "diff_ratio": 100.0,
+                "unified_diff": "",
+                "changed_sections": [],
+            }
+        
+        stats, hunks, changed_sections = DiffReportGenerator._diff_contents(
+            original_content,
+            modernized_content,
+            include_diff
+        )
+        
+        # Only the unified diff header names the file; the rest is shared
+        unified_diff = ""
+        if hunks:
+            unified_diff = f"--- original/{filename}+++ modernized/{filename}{hunks}"
+        
+        return {
+            "filename": filename,
+            **stats,
+            "unified_diff": unified_diff,
+            "changed_sections": copy.deepcopy(list(changed_sections)),
+        }
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _diff_contents(original_content: str, modernized_content: str, include_diff: bool) -> Tuple[Dict, str, Tuple]:
+        """
+        Filename-independent part of generate_file_diff
+        
+        Memoized on the contents, so copy-pasted files that receive the same
+        modernization (boilerplate controllers, generated code) are diffed
+        once. The returned objects are shared between calls, so
+        generate_file_diff hands out copies of them.
+        
+        Returns: (line statistics with diff_ratio, unified diff hunks text, changed sections)
+        """
         original_lines = original_content.splitlines(keepends=True)
         modernized_lines = modernized_content.splitlines(keepends=True)
         
-        # Generate unified diff
-        diff = list(difflib.unified_diff(
-            original_lines,
-            modernized_lines,
-            fromfile=f"original/{filename}",
-            tofile=f"modernized/{filename}",
-            lineterm=''
-        ))
+        # One line-level matcher feeds the statistics, the unified diff and the sections
+        matcher = difflib.SequenceMatcher(None, original_lines, modernized_lines, autojunk=False)
+        opcodes = matcher.get_opcodes()
         
         # Calculate statistics
-        added_lines = sum(1 for line in diff if line.startswith('+') and not line.startswith('+++'))
-        removed_lines = sum(1 for line in diff if line.startswith('-') and not line.startswith('---'))
+        added_lines = sum(j2 - j1 for tag, _, _, j1, j2 in opcodes if tag in ('insert', 'replace'))
+        removed_lines = sum(i2 - i1 for tag, i1, i2, _, _ in opcodes if tag in ('delete', 'replace'))
+        
+        # Generate unified diff hunks
+        hunks = ""
+        if include_diff:
+            hunks = ''.join(DiffReportGenerator._unified_diff_hunks(matcher, original_lines, modernized_lines))
         
         # Extract changed sections
         changed_sections = DiffReportGenerator._extract_changed_sections(
+            opcodes,
+            original_content,
             original_lines, 
-            modernized_lines, 
-            filename
+            modernized_content,
+            modernized_lines
         )
         
+        stats = {
+            "original_lines": len(original_lines),
+            "modernized_lines": len(modernized_lines),
+            "added_lines": added_lines,
+            "removed_lines": removed_lines,
+            "changed_lines": added_lines + removed_lines,
+            "diff_ratio": DiffReportGenerator._calculate_diff_ratio(original_content, modernized_content),
+        }
+        return stats, hunks, tuple(changed_sections)
+    
+    @staticmethod
+    def generate_file_stats(original_content: str, modernized_content: str, filename: str) -> Dict:
+        """
+        Cheap statistics-only counterpart of generate_file_diff
+        
+        Added/removed counts come from a line-level LCS rather than a
+        SequenceMatcher, so no opcodes, unified diff or sections are built.
+        The LCS gives the minimal diff, so on files where difflib's matching
+        is not minimal these counts can be slightly lower.
+        
+        Returns: Dict with the line statistics and diff_ratio of generate_file_diff
+        """
+        if original_content == modernized_content:
+            line_count = DiffReportGenerator._count_lines(original_content)
+            return {
+                "filename": filename,
+                "original_lines": line_count,
+                "modernized_lines": line_count,
+                "added_lines": 0,
+                "removed_lines": 0,
+                "changed_lines": 0,
+                "diff_ratio": 100.0,
+            }
+        
+        original_lines = original_content.splitlines(keepends=True)
+        modernized_lines = modernized_content.splitlines(keepends=True)
+        common_lines = _lcs_length(original_lines, modernized_lines)
+        added_lines = len(modernized_lines) - common_lines
+        removed_lines = len(original_lines) - common_lines
+        
         return {
             "filename": filename,
             "original_lines": len(original_lines),
@@ -52,33 +228,74 @@ class DiffReportGenerator:
             "removed_lines": removed_lines,
             "changed_lines": added_lines + removed_lines,
             "diff_ratio": DiffReportGenerator._calculate_diff_ratio(original_content, modernized_content),
-            "unified_diff": ''.join(diff),
-            "changed_sections": changed_sections,
         }
     
     @staticmethod
-    def _extract_changed_sections(original_lines: List[str], modernized_lines: List[str], filename: str) -> List[Dict]:
+    def _unified_diff_hunks(matcher: difflib.SequenceMatcher, original_lines: List[str], modernized_lines: List[str],
+                            context_lines: int = 3) -> List[str]:
         """
-        Extract individual changed sections from the diff
+        Render unified diff hunks from an existing matcher, as difflib.unified_diff(lineterm='') would
+        
+        The ---/+++ file header is left to the caller.
+        
+        Returns: List of diff lines
         """
-        sections = []
+        diff = []
         
-        matcher = difflib.SequenceMatcher(None, original_lines, modernized_lines)
+        for group in matcher.get_grouped_opcodes(context_lines):
+            first, last = group[0], group[-1]
+            file1_range = DiffReportGenerator._format_unified_range(first[1], last[2])
+            file2_range = DiffReportGenerator._format_unified_range(first[3], last[4])
+            diff.append(f"@@ -{file1_range} +{file2_range} @@")
+            
+            for tag, i1, i2, j1, j2 in group:
+                if tag == 'equal':
+                    diff.extend(' ' + line for line in original_lines[i1:i2])
+                    continue
+                if tag in ('replace', 'delete'):
+                    diff.extend('-' + line for line in original_lines[i1:i2])
+                if tag in ('replace', 'insert'):
+                    diff.extend('+' + line for line in modernized_lines[j1:j2])
         
-        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        return diff
+    
+    @staticmethod
+    def _format_unified_range(start: int, stop: int) -> str:
+        """Convert a slice range to the 'start,length' form used in unified diff hunk headers"""
+        beginning = start + 1
+        length = stop - start
+        if length == 1:
+            return f"{beginning}"
+        if not length:
+            beginning -= 1
+        return f"{beginning},{length}"
+    
+    @staticmethod
+    def _extract_changed_sections(opcodes: List[Tuple], original_content: str, original_lines: List[str],
+                                  modernized_content: str, modernized_lines: List[str]) -> List[Dict]:
+        """
+        Extract individual changed sections from precomputed line opcodes
+        
+        Section text is sliced straight out of the content using line start
+        offsets instead of re-joining slices of the line lists.
+        """
+        sections = []
+        original_starts = [0, *accumulate(map(len, original_lines))]
+        modernized_starts = [0, *accumulate(map(len, modernized_lines))]
+        
+        for tag, i1, i2, j1, j2 in opcodes:
             if tag != 'equal':
+                original_code = original_content[original_starts[i1]:original_starts[i2]]
+                modernized_code = modernized_content[modernized_starts[j1]:modernized_starts[j2]]
                 section = {
                     "type": tag,  # 'replace', 'insert', 'delete'
                     "original_start": i1 + 1,
                     "original_end": i2,
                     "modernized_start": j1 + 1,
                     "modernized_end": j2,
-                    "original_code": ''.join(original_lines[i1:i2]).strip(),
-                    "modernized_code": ''.join(modernized_lines[j1:j2]).strip(),
-                    "change_type": DiffReportGenerator._categorize_change(
-                        ''.join(original_lines[i1:i2]),
-                        ''.join(modernized_lines[j1:j2])
-                    )
+                    "original_code": original_code.strip(),
+                    "modernized_code": modernized_code.strip(),
+                    "change_type": DiffReportGenerator._categorize_change(original_code, modernized_code)
                 }
                 
                 if section["original_code"] or section["modernized_code"]:
@@ -91,43 +308,101 @@ class DiffReportGenerator:
         """
         Calculate similarity ratio between original and modernized code
         """
-        matcher = difflib.SequenceMatcher(None, original, modernized)
-        return round(matcher.ratio() * 100, 2)
+        if original == modernized:
+            return 100.0
+        
+        # Indel similarity is 2*LCS/(len(a)+len(b)). This approximates
+        # SequenceMatcher.ratio(), which counts difflib's matching blocks
+        # rather than a true LCS, so values can differ from the ratio()
+        # the report used before; _lcs_similarity gives the same value as Indel
+        if Indel is not None:
+            return round(Indel.normalized_similarity(original, modernized) * 100, 2)
+        
+        return round(_lcs_similarity(original, modernized) * 100, 2)
+    
+    @staticmethod
+    def _count_lines(content: str) -> int:
+        """
+        Count lines exactly as len(content.splitlines()) would, without building a list
+        
+        Returns: the number of lines, counting a last unterminated one
+        """
+        if not content:
+            return 0
+        if _RARE_LINE_BREAKS_RE.search(content):
+            return len(content.splitlines())
+        breaks = content.count('\n') + content.count('\r') - content.count('\r\n')
+        return breaks + (not content.endswith(('\n', '\r')))
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _categorize_change(original_code: str, modernized_code: str) -> str:
         """
         Categorize the type of change made
+        
+        Memoized: the same import or annotation change tends to repeat
+        across many files of a project.
         """
         
+        # One scan per side collects every marker the rules below look at
+        original_markers = set(_CHANGE_MARKERS_RE.findall(original_code))
+        modernized_markers = set(_CHANGE_MARKERS_RE.findall(modernized_code))
+        
         # javax to jakarta migration
-        if 'javax.' in original_code and 'jakarta.' in modernized_code:
+        if 'javax.' in original_markers and 'jakarta.' in modernized_markers:
             return "namespace_migration"
         
         # Import additions
-        if 'import' in modernized_code and 'import' not in original_code:
+        if 'import' in modernized_markers and 'import' not in original_markers:
             return "import_added"
         
         # Import removals
-        if 'import' in original_code and 'import' not in modernized_code:
+        if 'import' in original_markers and 'import' not in modernized_markers:
             return "import_removed"
         
         # Comment additions
-        if '//' in modernized_code and '//' not in original_code:
+        if '//' in modernized_markers and '//' not in original_markers:
             return "comment_added"
         
         # Deprecated API removal
-        if 'Deprecated' in original_code or '@Deprecated' in original_code:
+        if 'Deprecated' in original_markers:
             return "deprecated_removed"
         
         # Generic replacement
         return "code_updated"
     
     @staticmethod
-    def generate_project_diff_report(file_diffs: List[Dict]) -> Dict:
+    def generate_file_diffs_parallel(triples: List[Tuple[str, str, str]], max_workers: Optional[int] = None,
+                                     include_diff: bool = True) -> List[Dict]:
+        """
+        Generate file diffs for many (original, modernized, filename) triples across processes
+        
+        difflib is pure Python, so worker processes rather than threads are
+        needed to use more than one core. Small inputs are diffed inline to
+        avoid the pool start-up cost.
+        
+        Returns: File diffs aligned with triples
+        """
+        if not triples:
+            return []
+        
+        worker = partial(_generate_file_diff, include_diff=include_diff)
+        max_workers = max_workers or min(len(triples), os.cpu_count() or 1)
+        if max_workers <= 1 or len(triples) < 2:
+            return [worker(triple) for triple in triples]
+        
+        chunksize = max(1, min(8, len(triples) // (max_workers * 4)))
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=worker_context()) as executor:
+            return list(executor.map(worker, triples, chunksize=chunksize))
+    
+    @staticmethod
+    def generate_project_diff_report(file_diffs: List[Dict], include_diff: bool = True) -> Dict:
         """
         Generate an overall project-level diff report
         
+        With include_diff=False the per-file entries are listed without their
+        unified diff text, keeping stats-only reports small.
+        
         Returns: Comprehensive report with statistics
         """
         
@@ -174,7 +449,9 @@ class DiffReportGenerator:
                 }
                 for f in most_modified
             ],
-            "files": file_diffs
+            "files": file_diffs if include_diff else [
+                {**file_diff, "unified_diff": ""} for file_diff in file_diffs
+            ]
         }
     
     @staticmethod
@@ -183,97 +460,57 @@ class DiffReportGenerator:
         Generate HTML side-by-side comparison view
         """
         
-        html = """
-        <table style="width:100%; border-collapse: collapse; font-family: monospace;">
-            <tr style="background-color: #f0f0f0;">
-                <th style="width: 50%; padding: 10px; border: 1px solid #ddd;">Original</th>
-                <th style="width: 50%; padding: 10px; border: 1px solid #ddd;">Modernized</th>
-            </tr>
-        """
+        parts = [_TABLE_HEADER]
         
         original_lines = original_code.splitlines()
         modernized_lines = modernized_code.splitlines()
         
-        matcher = difflib.SequenceMatcher(None, original_lines, modernized_lines)
+        if original_code == modernized_code:
+            # Identical inputs render as one run of unchanged rows
+            opcodes = [('equal', 0, len(original_lines), 0, len(original_lines))]
+        else:
+            opcodes = difflib.SequenceMatcher(None, original_lines, modernized_lines, autojunk=False).get_opcodes()
+        
+        escape = DiffReportGenerator._escape_html
+        row = _ROW_TEMPLATE.format
         
-        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        for tag, i1, i2, j1, j2 in opcodes:
             if tag == 'equal':
                 # Show equal lines
-                for i in range(i2 - i1):
-                    line = original_lines[i1 + i]
-                    html += f"""
-                    <tr>
-                        <td style="padding: 5px; border: 1px solid #ddd; background-color: #fff;">{DiffReportGenerator._escape_html(line)}</td>
-                        <td style="padding: 5px; border: 1px solid #ddd; background-color: #fff;">{DiffReportGenerator._escape_html(line)}</td>
-                    </tr>
-                    """
+                for line in original_lines[i1:i2]:
+                    escaped = escape(line)
+                    parts.append(row('e', escaped, 'e', escaped))
             
             elif tag == 'delete':
                 # Show removed lines
-                for i in range(i2 - i1):
-                    line = original_lines[i1 + i]
-                    html += f"""
-                    <tr>
-                        <td style="padding: 5px; border: 1px solid #ddd; background-color: #ffcccc;">{DiffReportGenerator._escape_html(line)}</td>
-                        <td style="padding: 5px; border: 1px solid #ddd; background-color: #fff;"></td>
-                    </tr>
-                    """
+                for line in original_lines[i1:i2]:
+                    parts.append(row('d', escape(line), 'e', ''))
             
             elif tag == 'insert':
                 # Show added lines
-                for j in range(j2 - j1):
-                    line = modernized_lines[j1 + j]
-                    html += f"""
-                    <tr>
-                        <td style="padding: 5px; border: 1px solid #ddd; background-color: #fff;"></td>
-                        <td style="padding: 5px; border: 1px solid #ddd; background-color: #ccffcc;">{DiffReportGenerator._escape_html(line)}</td>
-                    </tr>
-                    """
+                for line in modernized_lines[j1:j2]:
+                    parts.append(row('e', '', 'a', escape(line)))
             
             elif tag == 'replace':
                 # Show replaced lines
-                for i, j in zip(range(i1, i2), range(j1, j2)):
-                    orig_line = original_lines[i] if i < len(original_lines) else ""
-                    mod_line = modernized_lines[j] if j < len(modernized_lines) else ""
-                    html += f"""
-                    <tr>
-                        <td style="padding: 5px; border: 1px solid #ddd; background-color: #ffeecc;">{DiffReportGenerator._escape_html(orig_line)}</td>
-                        <td style="padding: 5px; border: 1px solid #ddd; background-color: #eeffcc;">{DiffReportGenerator._escape_html(mod_line)}</td>
-                    </tr>
-                    """
+                for orig_line, mod_line in zip(original_lines[i1:i2], modernized_lines[j1:j2]):
+                    parts.append(row('ro', escape(orig_line), 'rm', escape(mod_line)))
                 
                 # Handle extra lines if replacement has different number of lines
                 if i2 - i1 > j2 - j1:
-                    for i in range(j2 - j1, i2 - i1):
-                        line = original_lines[i1 + i]
-                        html += f"""
-                        <tr>
-                            <td style="padding: 5px; border: 1px solid #ddd; background-color: #ffeecc;">{DiffReportGenerator._escape_html(line)}</td>
-                            <td style="padding: 5px; border: 1px solid #ddd; background-color: #fff;"></td>
-                        </tr>
-                        """
+                    for line in original_lines[i1 + (j2 - j1):i2]:
+                        parts.append(row('ro', escape(line), 'e', ''))
                 elif j2 - j1 > i2 - i1:
-                    for j in range(i2 - i1, j2 - j1):
-                        line = modernized_lines[j1 + j]
-                        html += f"""
-                        <tr>
-                            <td style="padding: 5px; border: 1px solid #ddd; background-color: #fff;"></td>
-                            <td style="padding: 5px; border: 1px solid #ddd; background-color: #eeffcc;">{DiffReportGenerator._escape_html(line)}</td>
-                        </tr>
-                        """
-        
-        html += "</table>"
-        return html
+                    for line in modernized_lines[j1 + (i2 - i1):j2]:
+                        parts.append(row('e', '', 'rm', escape(line)))
+        
+        parts.append("</table>")
+        return "".join(parts)
     
     @staticmethod
     def _escape_html(text: str) -> str:
-        """Escape HTML special characters"""
-        text = text.replace("&", "&amp;")
-        text = text.replace("<", "&lt;")
-        text = text.replace(">", "&gt;")
-        text = text.replace('"', "&quot;")
-        text = text.replace("'", "&#39;")
-        return text
+        """Escape HTML special characters in a single pass"""
+        return text.translate(DiffReportGenerator.HTML_ESCAPE_TABLE)
     
     @staticmethod
     def export_diff_report_json(report: Dict, output_path: str) -> bool:
@@ -281,8 +518,25 @@ class DiffReportGenerator:
         Export diff report as JSON file
         """
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2)
+            # Lists (the per-file diffs in particular) are written one element
+            # at a time so large unified diffs never sit in one encoded string
+            with open(output_path, 'wb') as f:
+                f.write(b'{')
+                for index, (key, value) in enumerate(report.items()):
+                    if index:
+                        f.write(b', ')
+                    f.write(json_bytes(key))
+                    f.write(b': ')
+                    if isinstance(value, list):
+                        f.write(b'[')
+                        for item_index, item in enumerate(value):
+                            if item_index:
+                                f.write(b', ')
+                            f.write(json_bytes(item))
+                        f.write(b']')
+                    else:
+                        f.write(json_bytes(value))
+                f.write(b'}\n')
             logger.info(f"Diff report exported to {output_path}")
             return True
         except Exception as e:
@@ -290,5 +544,10 @@ class DiffReportGenerator:
             return False
 
 
+def _generate_file_diff(triple: Tuple[str, str, str], include_diff: bool = True) -> Dict:
+    """Module-level so it can be pickled into worker processes"""
+    return DiffReportGenerator.generate_file_diff(*triple, include_diff=include_diff)
+
+
 # Singleton instance
 diff_report_generator = DiffReportGenerator()
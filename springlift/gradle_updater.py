@@ -2,11 +2,25 @@
 Gradle build.gradle Updater
 Updates dependency versions and properties in build.gradle for modernization
 """
+import copy
+import os
 import re
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
+from ._io import write_atomic
 from .logger import logger
 
 
+# Patterns compiled once at import rather than on every update call
+_SOURCE_COMPAT_RE = re.compile(r"sourceCompatibility\s*=\s*['\"]?([\d\.]+)['\"]?")
+_TARGET_COMPAT_RE = re.compile(r"targetCompatibility\s*=\s*['\"]?([\d\.]+)['\"]?")
+_SOURCE_COMPAT_ENUM_RE = re.compile(r"sourceCompatibility\s*=\s*JavaVersion\.VERSION_(\d+)")
+_TARGET_COMPAT_ENUM_RE = re.compile(r"targetCompatibility\s*=\s*JavaVersion\.VERSION_(\d+)")
+_BOOT_PLUGIN_RE = re.compile(r"(id\s+['\"]org\.springframework\.boot['\"]\s+version\s+)['\"][\d\.]+['\"]")
+_BOOT_PLUGIN_VERSION_RE = re.compile(r"id\s+['\"]org\.springframework\.boot['\"]\s+version\s+['\"]([^'\"]+)['\"]")
+_DEPENDENCY_RE = re.compile(r"['\"]?([^:'\"\s]+):([^:'\"\s]+):([^'\"]+)['\"]?")
+
+
 class GradleUpdater:
     """
     Updates Gradle build.gradle files to modernize dependencies and Java versions
@@ -46,15 +60,49 @@ class GradleUpdater:
         'org.slf4j:slf4j-api': '2.0.7',
     }
 
-    def update_build_gradle(self, gradle_path: str) -> Tuple[bool, str, List[str]]:
+    def update_build_gradle(
+        self,
+        gradle_path: str,
+        content: Optional[bytes] = None,
+        output_path: Optional[str] = None
+    ) -> Tuple[bool, str, List[str]]:
         """
         Update build.gradle with modernized versions
+        
+        content and output_path work as in update_build_gradle_with_info.
         Returns: (success, message, changes_made)
         """
+        success, message, changes, _ = self.update_build_gradle_with_info(gradle_path, content, output_path)
+        return success, message, changes
+
+    def update_build_gradle_with_info(
+        self,
+        gradle_path: str,
+        content: Optional[bytes] = None,
+        output_path: Optional[str] = None
+    ) -> Tuple[bool, str, List[str], Dict]:
+        """
+        Update build.gradle and extract its pre-update info from a single read
+        
+        Saves callers that need both a second read and scan via get_gradle_info.
+        content, when the caller already holds the file's bytes, skips the
+        read. output_path writes the result there instead of over
+        gradle_path, and is written even when nothing changed, so it
+        replaces a copy.
+        Returns: (success, message, changes_made, info)
+        """
+        info = self._empty_gradle_info()
+        
         try:
-            with open(gradle_path, 'r', encoding='utf-8') as f:
-                gradle_content = f.read()
+            if content is None:
+                with open(gradle_path, 'rb') as f:
+                    content = f.read()
+            gradle_content = content.decode('utf-8')
+            if '\r' in gradle_content:
+                # Same universal-newline translation a text-mode read applies
+                gradle_content = gradle_content.replace('\r\n', '\n').replace('\r', '\n')
             
+            info = self._parse_gradle_info(gradle_content)
             original_content = gradle_content
             changes = []
 
@@ -75,46 +123,43 @@ class GradleUpdater:
                 # Add modernization comment ONLY if we're making changes
                 gradle_content = self._add_modernization_comment_internal(gradle_content)
                 
-                with open(gradle_path, 'w', encoding='utf-8') as f:
-                    f.write(gradle_content)
+                write_atomic(output_path or gradle_path, gradle_content)
                 logger.info(f"Updated build.gradle: {len(changes)} changes made")
-                return True, f"Successfully updated build.gradle with {len(changes)} changes", changes
+                return True, f"Successfully updated build.gradle with {len(changes)} changes", changes, info
             else:
                 # No changes needed - don't touch the file at all
+                if output_path:
+                    write_atomic(output_path, content)
                 logger.info("No changes needed in build.gradle")
-                return True, "build.gradle is already up to date", []
+                return True, "build.gradle is already up to date", [], info
 
         except Exception as e:
             error_msg = f"Error updating build.gradle: {str(e)}"
             logger.error(error_msg)
-            return False, error_msg, []
+            return False, error_msg, [], info
 
     def _update_java_version(self, content: str) -> Tuple[str, List[str]]:
         """Update Java version to 21"""
         changes = []
 
         # Update sourceCompatibility
-        pattern = r"sourceCompatibility\s*=\s*['\"]?[\d\.]+['\"]?"
-        if re.search(pattern, content):
-            content = re.sub(pattern, "sourceCompatibility = '21'", content)
+        content, count = _SOURCE_COMPAT_RE.subn("sourceCompatibility = '21'", content)
+        if count:
             changes.append("Updated sourceCompatibility to 21")
         else:
             # Check if it's in a different format (like JavaVersion.VERSION_XX)
-            pattern = r"sourceCompatibility\s*=\s*JavaVersion\.VERSION_\d+"
-            if re.search(pattern, content):
-                content = re.sub(pattern, "sourceCompatibility = JavaVersion.VERSION_21", content)
+            content, count = _SOURCE_COMPAT_ENUM_RE.subn("sourceCompatibility = JavaVersion.VERSION_21", content)
+            if count:
                 changes.append("Updated sourceCompatibility to Java 21")
 
         # Update targetCompatibility
-        pattern = r"targetCompatibility\s*=\s*['\"]?[\d\.]+['\"]?"
-        if re.search(pattern, content):
-            content = re.sub(pattern, "targetCompatibility = '21'", content)
+        content, count = _TARGET_COMPAT_RE.subn("targetCompatibility = '21'", content)
+        if count:
             changes.append("Updated targetCompatibility to 21")
         else:
             # Check if it's in a different format (like JavaVersion.VERSION_XX)
-            pattern = r"targetCompatibility\s*=\s*JavaVersion\.VERSION_\d+"
-            if re.search(pattern, content):
-                content = re.sub(pattern, "targetCompatibility = JavaVersion.VERSION_21", content)
+            content, count = _TARGET_COMPAT_ENUM_RE.subn("targetCompatibility = JavaVersion.VERSION_21", content)
+            if count:
                 changes.append("Updated targetCompatibility to Java 21")
 
         return content, changes
@@ -124,13 +169,8 @@ class GradleUpdater:
         changes = []
 
         # Update spring-boot plugin id
-        pattern = r"id\s+['\"]org\.springframework\.boot['\"]\s+version\s+['\"][\d\.]+['\"]"
-        if re.search(pattern, content):
-            content = re.sub(
-                r"(id\s+['\"]org\.springframework\.boot['\"]\s+version\s+)['\"][\d\.]+['\"]",
-                r"\g<1>'3.2.0'",
-                content
-            )
+        content, count = _BOOT_PLUGIN_RE.subn(r"\g<1>'3.2.0'", content)
+        if count:
             changes.append("Updated Spring Boot plugin to 3.2.0")
 
         return content, changes
@@ -139,21 +179,16 @@ class GradleUpdater:
         """Update Spring Boot and framework dependency versions"""
         changes = []
 
-        # Handle various dependency declaration formats in Gradle
-        
-        # Format 1: 'group:name:version'
-        for dep_full, new_version in self.DEPENDENCY_VERSIONS.items():
-            if ':' in dep_full:
-                group, name = dep_full.rsplit(':', 1)
-                pattern = rf"['\"]?{re.escape(group)}:{re.escape(name)}:[^['\"]]+['\"]?"
-                
-                matches = list(re.finditer(pattern, content))
-                if matches:
-                    for match in matches:
-                        old_dep = match.group(0)
-                        new_dep = f"'{group}:{name}:{new_version}'"
-                        content = content.replace(old_dep, new_dep, 1)
-                        changes.append(f"Updated {name} to {new_version}")
+        # Format 1: 'group:name:version' -- every known coordinate in a single pass
+        def replace_version(match):
+            quote, coordinate, version = match.group(1), match.group(2), match.group(3)
+            new_version = self.DEPENDENCY_VERSIONS[coordinate]
+            if version == new_version:
+                return match.group(0)
+            changes.append(f"Updated {coordinate.rsplit(':', 1)[1]} to {new_version}")
+            return f"{quote}{coordinate}:{new_version}{quote}"
+
+        content = _KNOWN_DEPENDENCY_RE.sub(replace_version, content)
 
         return content, changes
 
@@ -182,8 +217,7 @@ class GradleUpdater:
             comment = '// MODERNIZED by SpringLift v2.1.1 - Updated to Java 21 and Spring Boot 3.x\n'
             content = comment + content
             
-            with open(gradle_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            write_atomic(gradle_path, content)
             
             logger.info(f"Added modernization comment to {gradle_path}")
             return True
@@ -192,48 +226,84 @@ class GradleUpdater:
             return False
 
     def get_gradle_info(self, gradle_path: str) -> Dict:
-        """Extract key information from build.gradle"""
-        info = {
+        """
+        Extract key information from build.gradle
+        
+        Parsed info is reused until the file's mtime or size changes. Each
+        call gets its own copy, so callers may mutate it; failed reads are
+        not cached.
+        """
+        try:
+            st = os.stat(gradle_path)
+            info = self._get_gradle_info_cached(gradle_path, st.st_mtime_ns, st.st_size)
+        except Exception as e:
+            logger.error(f"Error reading build.gradle info: {str(e)}")
+            return self._empty_gradle_info()
+        
+        # The cached dict must stay intact
+        return copy.deepcopy(info)
+
+    @staticmethod
+    def _empty_gradle_info() -> Dict:
+        """Info dict returned when nothing could be extracted"""
+        return {
             'project_name': None,
             'current_java_version': None,
             'current_spring_boot_version': None,
             'dependencies': []
         }
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_gradle_info_cached(gradle_path: str, mtime_ns: int, size: int) -> Dict:
+        """
+        Cache wrapper; mtime_ns and size only participate in the cache key
         
-        try:
-            with open(gradle_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extract Java version
-            match = re.search(r"sourceCompatibility\s*=\s*['\"]?([\d\.]+)['\"]?", content)
+        Raises on read errors, which lru_cache does not memoize.
+        """
+        with open(gradle_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        return GradleUpdater._parse_gradle_info(content)
+
+    @staticmethod
+    def _parse_gradle_info(content: str) -> Dict:
+        """Extract key information from build.gradle content"""
+        info = GradleUpdater._empty_gradle_info()
+        
+        # Extract Java version
+        match = _SOURCE_COMPAT_RE.search(content)
+        if match:
+            info['current_java_version'] = match.group(1)
+        else:
+            match = _SOURCE_COMPAT_ENUM_RE.search(content)
             if match:
                 info['current_java_version'] = match.group(1)
-            else:
-                match = re.search(r"sourceCompatibility\s*=\s*JavaVersion\.VERSION_(\d+)", content)
-                if match:
-                    info['current_java_version'] = match.group(1)
-            
-            # Extract Spring Boot version
-            match = re.search(
-                r"id\s+['\"]org\.springframework\.boot['\"]\s+version\s+['\"]([^'\"]+)['\"]",
-                content
-            )
-            if match:
-                info['current_spring_boot_version'] = match.group(1)
-            
-            # Extract dependencies
-            dep_pattern = r"['\"]?([^:'\"\s]+):([^:'\"\s]+):([^'\"]+)['\"]?"
-            for match in re.finditer(dep_pattern, content):
-                info['dependencies'].append({
-                    'group': match.group(1),
-                    'name': match.group(2),
-                    'version': match.group(3)
-                })
-            
-            return info
-        except Exception as e:
-            logger.error(f"Error reading build.gradle info: {str(e)}")
-            return info
+        
+        # Extract Spring Boot version
+        match = _BOOT_PLUGIN_VERSION_RE.search(content)
+        if match:
+            info['current_spring_boot_version'] = match.group(1)
+        
+        # Extract dependencies
+        for match in _DEPENDENCY_RE.finditer(content):
+            info['dependencies'].append({
+                'group': match.group(1),
+                'name': match.group(2),
+                'version': match.group(3)
+            })
+        
+        return info
+
+
+# Alternation of every known group:name, longest first so no coordinate shadows another
+_KNOWN_DEPENDENCY_RE = re.compile(
+    r"(['\"])("
+    + "|".join(re.escape(dep) for dep in sorted(
+        (dep for dep in GradleUpdater.DEPENDENCY_VERSIONS if ':' in dep), key=len, reverse=True
+    ))
+    + r"):([^'\"\s]+)\1"
+)
 
 
 # Global instance
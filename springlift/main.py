@@ -1,4 +1,4 @@
-from fastapi import FastAPI, Body, HTTPException
+from fastapi import FastAPI, BackgroundTasks, Body, HTTPException, Request, Response
 from fastapi.responses import JSONResponse
 from .models import ScanRequest, ScanResult, ProjectAnalysis
 from .services import genai_service
@@ -7,14 +7,54 @@ from .exceptions import ScanNotFoundException
 from .logger import logger
 from .validator import InputValidator, validate_request
 from .batch_processor import batch_processor
+import asyncio
 import os
 
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib encoder
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson when it is installed
+    
+    Only for routes without a response_model: those already take FastAPI's
+    own Pydantic-to-bytes path, which a custom response class would disable.
+    """
+    
+    def render(self, content) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content)
+
+
 app = FastAPI(
     title="SpringLift",
     description="A GenAI-powered tool to help modernize legacy Java applications. Scans Java 8/11 with Spring Boot 2.x and upgrades to Java 21 with Spring Boot 3.x.",
     version="2.0.0"
 )
 
+def _scan_slots() -> asyncio.Semaphore:
+    """
+    Semaphore bounding how many blocking scans run at once; the per-file work
+    inside each scan is already spread across the shared analysis process pool
+    
+    Created on first use inside the running event loop, not at import, and
+    kept on app.state.
+    Returns: the app's scan semaphore
+    """
+    slots = getattr(app.state, "scan_slots", None)
+    if slots is None:
+        slots = app.state.scan_slots = asyncio.Semaphore(os.cpu_count() or 1)
+    return slots
+
+async def _run_blocking(func, *args):
+    """Run a blocking call on the default thread pool so the event loop stays free"""
+    async with _scan_slots():
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
 @app.post("/scan", response_model=ScanResult)
 async def scan_code(request: ScanRequest = Body(...)):
     """
@@ -38,37 +78,105 @@ async def scan_code(request: ScanRequest = Body(...)):
         logger.error(f"Validation failed: {error_msg}")
         raise HTTPException(status_code=400, detail=error_msg)
     
-    result = genai_service.analyze_code(request)
+    result = await _run_blocking(genai_service.analyze_code, request)
     save_scan_result(result)
     logger.info(f"Scan complete. Result ID: {result.id}")
     return result
 
+async def _run_scan_in_background(pending: ScanResult) -> None:
+    """Run a queued scan and store its result under the pending scan's ID"""
+    save_scan_result(pending.model_copy(update={"status": "in_progress"}))
+    try:
+        result = await _run_blocking(genai_service.analyze_code, pending.request)
+        result = result.model_copy(update={"id": pending.id, "created_at": pending.created_at})
+    except Exception as e:
+        logger.error(f"Background scan {pending.id} failed: {str(e)}")
+        result = pending.model_copy(update={"status": "failed", "error_message": str(e)})
+    save_scan_result(result)
+    logger.info(f"Background scan complete. Result ID: {result.id}")
+
+@app.post("/scan/async", response_model=ScanResult, status_code=202)
+async def scan_code_async(background_tasks: BackgroundTasks, request: ScanRequest = Body(...)):
+    """
+    Queues a scan and returns at once with status "pending".
+    
+    Takes the same request body as POST /scan. The scan runs after the
+    response is sent; poll GET /scan/{id} (or POST /scan/async/{id} for
+    just the status) until the status is "completed" or "failed".
+    """
+    logger.info(f"Received async scan request for project_path: {request.project_path}")
+    
+    is_valid, error_msg = validate_request(request)
+    if not is_valid:
+        logger.error(f"Validation failed: {error_msg}")
+        raise HTTPException(status_code=400, detail=error_msg)
+    
+    pending = ScanResult(
+        request=request,
+        output_path=f"{request.project_path}_modernized",
+        status="pending"
+    )
+    save_scan_result(pending)
+    background_tasks.add_task(_run_scan_in_background, pending)
+    logger.info(f"Scan queued. Result ID: {pending.id}")
+    return pending
+
+# A stored result never changes once its scan has finished
+_FINAL_SCAN_STATUSES = ("completed", "failed")
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an If-None-Match header value matches etag (weak comparison)"""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
 @app.get("/scan/{scan_id}", response_model=ScanResult)
-async def get_scan(scan_id: str):
+async def get_scan(scan_id: str, request: Request, response: Response):
     """
     Retrieves a previously completed scan result by its ID.
     
-    Returns the full ScanResult with all analysis details.
+    Returns the full ScanResult with all analysis details. Responses carry
+    an ETag; a matching If-None-Match gets 304 Not Modified without a body.
+    Finished results may be cached for a year, but only by the client
+    (private), since they hold local paths and analysis of private code.
+    The server itself keeps only the most recent results in memory unless
+    SPRINGLIFT_SCAN_DB is set, so a client's cached copy can outlive the
+    server's and a later fetch of the same ID may get 404.
     """
     logger.info(f"Retrieving scan result for ID: {scan_id}")
     result = get_scan_result(scan_id)
     if not result:
         logger.error(f"Scan with ID '{scan_id}' not found.")
         raise ScanNotFoundException(scan_id)
+    
+    headers = {
+        "ETag": f'"{scan_id}-{result.status}"',
+        "Cache-Control": (
+            "private, max-age=31536000, immutable"
+            if result.status in _FINAL_SCAN_STATUSES else "no-cache"
+        ),
+    }
+    if _etag_matches(request.headers.get("if-none-match", ""), headers["ETag"]):
+        logger.info(f"Scan result for ID '{scan_id}' not modified.")
+        return Response(status_code=304, headers=headers)
+    
     logger.info(f"Scan result for ID '{scan_id}' found.")
+    response.headers.update(headers)
     return result
 
-@app.post("/scan/async/{scan_id}")
+@app.post("/scan/async/{scan_id}", response_class=FastJSONResponse)
 async def get_async_scan_status(scan_id: str):
     """
-    Get the status of an asynchronous scan (for future implementation).
+    Get the status of an asynchronous scan started with POST /scan/async.
     """
     result = get_scan_result(scan_id)
     if not result:
         raise ScanNotFoundException(scan_id)
     return {"scan_id": scan_id, "status": result.status, "created_at": result.created_at}
 
-@app.get("/health")
+@app.get("/health", response_class=FastJSONResponse)
 async def health_check():
     """Health check endpoint"""
     return {
@@ -77,7 +185,7 @@ async def health_check():
         "version": "2.0.0"
     }
 
-@app.get("/")
+@app.get("/", response_class=FastJSONResponse)
 async def root():
     """Welcome endpoint with API information"""
     return {
@@ -98,7 +206,7 @@ async def root():
         ]
     }
 
-@app.post("/batch/add")
+@app.post("/batch/add", response_class=FastJSONResponse)
 async def add_to_batch(project_paths: dict = Body(...)):
     """
     Add projects to batch processing queue
@@ -127,7 +235,7 @@ async def add_to_batch(project_paths: dict = Body(...)):
         "projects_added": added
     }
 
-@app.post("/batch/process")
+@app.post("/batch/process", response_class=FastJSONResponse)
 async def process_batch():
     """
     Process all projects in the batch queue
@@ -136,14 +244,14 @@ async def process_batch():
     if not batch_processor.projects:
         raise HTTPException(status_code=400, detail="Batch queue is empty")
     
-    report = batch_processor.process_batch()
+    report = await _run_blocking(batch_processor.process_batch)
     
     return {
         "message": "Batch processing completed",
         "report": report
     }
 
-@app.get("/batch/status")
+@app.get("/batch/status", response_class=FastJSONResponse)
 async def batch_status():
     """
     Get status of batch processing
@@ -153,11 +261,11 @@ async def batch_status():
         "batch_id": batch_processor.batch_id,
         "status": "processing" if batch_processor.projects else "idle",
         "queue_size": len(batch_processor.projects),
-        "processed": len(batch_processor.results),
+        "processed": batch_processor.completed_count,
         "summary": batch_processor.get_batch_summary()
     }
 
-@app.post("/batch/clear")
+@app.post("/batch/clear", response_class=FastJSONResponse)
 async def clear_batch():
     """
     Clear batch queue
@@ -1,7 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import List, Dict, Optional
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 
 class ScanRequest(BaseModel):
     project_path: str = Field(..., description="The path to the legacy Java project to be scanned.")
@@ -33,6 +33,6 @@ class ScanResult(BaseModel):
     request: ScanRequest
     output_path: str = Field(..., description="The path to the modernized project.")
     project_analysis: ProjectAnalysis = Field(default_factory=ProjectAnalysis)
-    created_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     status: str = Field(default="completed", description="Status: pending, in_progress, completed, failed")
     error_message: Optional[str] = None
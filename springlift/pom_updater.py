@@ -2,12 +2,106 @@
 Maven pom.xml Updater
 Updates dependency versions and properties in pom.xml for modernization
 """
+import os
 import re
 import xml.etree.ElementTree as ET
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Tuple
+from ._io import mapped_file, write_atomic
+from ._process import worker_context
 from .logger import logger
 
 
+# Patterns compiled once at import rather than on every update call. They are
+# bytes patterns: poms are read and written as raw bytes, and every pattern is
+# ASCII, so the whole-file UTF-8 decode/encode round trip is skipped. Element
+# text is matched with [^<]* rather than a lazy .*?, which has to try the
+# closing tag after every character
+# The parent pattern only looks inside the <parent> block: the tempered
+# (?:(?!</parent>).)*? runs stop at </parent> instead of scanning the rest of the pom
+_PARENT_VERSION_RE = re.compile(
+    rb'(<parent>(?:(?!</parent>).)*?<artifactId>spring-boot-starter-parent</artifactId>'
+    rb'(?:(?!</parent>).)*?<version>)([0-9\.]+)(\.RELEASE)?</version>',
+    re.DOTALL
+)
+_JAVA_VERSION_RE = re.compile(rb'<java\.version>[^<]*</java\.version>')
+_COMPILER_SOURCE_RE = re.compile(rb'<maven\.compiler\.source>[^<]*</maven\.compiler\.source>')
+_COMPILER_TARGET_RE = re.compile(rb'<maven\.compiler\.target>[^<]*</maven\.compiler\.target>')
+_BOOT_VERSION_PROPERTY_RE = re.compile(rb'<spring-boot\.version>[^<]*</spring-boot\.version>')
+_BOOT_PLUGIN_RE = re.compile(rb'(<artifactId>spring-boot-maven-plugin</artifactId>\s*<version>)[^<]*(</version>)')
+_COMPILER_PLUGIN_RE = re.compile(
+    rb'<artifactId>maven-compiler-plugin</artifactId>(?P<version>\s*<version>[^<]*</version>)?'
+)
+_SUREFIRE_PLUGIN_RE = re.compile(rb'(<artifactId>maven-surefire-plugin</artifactId>\s*<version>)[^<]*(</version>)')
+
+# (pattern, replacement tag, updated message, added message) for the compiler
+# properties _update_java_version manages, formatted once here
+_COMPILER_PROPERTIES = tuple(
+    (
+        pattern,
+        f'<{prop_name}>21</{prop_name}>'.encode(),
+        f"Updated {prop_name} to 21",
+        f"Added {prop_name} property (21)",
+    )
+    for prop_name, pattern in (
+        ('maven.compiler.source', _COMPILER_SOURCE_RE),
+        ('maven.compiler.target', _COMPILER_TARGET_RE),
+    )
+)
+
+# get_pom_info lookups
+_ARTIFACT_ID_VALUE_RE = re.compile(rb'<artifactId>([^<]*)</artifactId>')
+_JAVA_VERSION_VALUE_RE = re.compile(rb'<java\.version>([^<]*)</java\.version>')
+_COMPILER_SOURCE_VALUE_RE = re.compile(rb'<maven\.compiler\.source>([^<]*)</maven\.compiler\.source>')
+_BOOT_VERSION_VALUE_RE = re.compile(rb'<spring-boot\.version>([^<]*)</spring-boot\.version>')
+_PARENT_TAIL_VERSION_RE = re.compile(rb'<version>(\d+\.\d+\.\d+)</version>\s*\n\s*</parent>')
+_DEPENDENCY_VERSION_RE = re.compile(rb'<artifactId>([^<]*)</artifactId>\s*<version>([^<]*)</version>')
+
+
+def _splice(content: bytes, edits: List[Tuple[int, int, bytes]]) -> bytes:
+    """
+    Apply (start, end, new_text) edits, all given in offsets of the original
+    content, with one join instead of a full-file copy per edit.
+    Edits at the same offset keep the order they were collected in.
+    Returns: rewritten content
+    """
+    if not edits:
+        return content
+    
+    parts = []
+    pos = 0
+    for start, end, new_text in sorted(edits, key=lambda edit: edit[0]):
+        if start < pos:
+            raise ValueError(f"Overlapping pom edits at offset {start}")
+        parts.append(content[pos:start])
+        parts.append(new_text)
+        pos = end
+    parts.append(content[pos:])
+    return b''.join(parts)
+
+
+def _normalize_newlines(content: bytes) -> bytes:
+    """
+    Convert CRLF/CR line endings to LF, as text-mode reads did, so rewritten
+    poms keep a single line-ending style
+    Returns: content with LF line endings
+    """
+    if b'\r' not in content:
+        return content
+    return content.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+
+def _text(value: bytes) -> str:
+    """Decode an extracted pom value for the returned info"""
+    return value.decode('utf-8', errors='replace')
+
+
+_MODERNIZATION_COMMENT = b'\n<!-- MODERNIZED by SpringLift v2.1.1 - Updated to Java 21 and Spring Boot 3.x -->\n'
+# The XML declaration sits at the very start of the file (after an optional BOM)
+_PROLOG_SCAN_LIMIT = 256
+
+
 class PomUpdater:
     """
     Updates Maven pom.xml files to modernize dependencies and Java versions
@@ -71,53 +165,85 @@ class PomUpdater:
         'spring-boot.version': '3.2.0',
     }
 
-    def update_pom_xml(self, pom_path: str) -> Tuple[bool, str, List[str]]:
+    def update_pom_xml(
+        self,
+        pom_path: str,
+        content: Optional[bytes] = None,
+        output_path: Optional[str] = None
+    ) -> Tuple[bool, str, List[str]]:
         """
         Update pom.xml with modernized versions
+        
+        content, when the caller already holds the file's bytes, skips the
+        read. output_path writes the result there instead of over pom_path,
+        and is written even when nothing changed, so it replaces a copy.
         Returns: (success, message, changes_made)
         """
         try:
-            with open(pom_path, 'r', encoding='utf-8') as f:
-                pom_content = f.read()
+            if content is None:
+                with open(pom_path, 'rb') as f:
+                    content = f.read()
+            pom_content = _normalize_newlines(content)
             
             original_content = pom_content
             changes = []
 
+            # Cheap substring checks decide which regex stages can match at all,
+            # so library poms without Spring content skip the regex work entirely
+            has_parent = b'spring-boot-starter-parent' in pom_content
+            has_properties = (
+                b'</properties>' in pom_content
+                or b'<java.version>' in pom_content
+                or b'<maven.compiler.' in pom_content
+            )
+            has_boot_property = b'<spring-boot.version>' in pom_content
+            # Per-name checks would cost a scan each; the fused dependency
+            # pattern already searches for its "<artifactId>" prefix in one scan
+            has_dependencies = b'<artifactId>' in pom_content
+            has_plugins = b'maven-' in pom_content
+
             # Update parent version FIRST (most important for Spring Boot projects)
-            pom_content, parent_changes = self._update_parent_version(pom_content)
-            changes.extend(parent_changes)
+            if has_parent:
+                pom_content, parent_changes = self._update_parent_version(pom_content)
+                changes.extend(parent_changes)
 
             # Update Java version properties
-            pom_content, java_changes = self._update_java_version(pom_content)
-            changes.extend(java_changes)
+            if has_properties:
+                pom_content, java_changes = self._update_java_version(pom_content)
+                changes.extend(java_changes)
 
             # Update Spring Boot properties
-            pom_content, spring_changes = self._update_spring_boot_version(pom_content)
-            changes.extend(spring_changes)
+            if has_boot_property:
+                pom_content, spring_changes = self._update_spring_boot_version(pom_content)
+                changes.extend(spring_changes)
 
             # Update dependencies in XML
-            pom_content, dep_changes = self._update_dependencies(pom_content)
-            changes.extend(dep_changes)
+            if has_dependencies:
+                pom_content, dep_changes = self._update_dependencies(pom_content)
+                changes.extend(dep_changes)
 
-            # Update property versions
-            pom_content, prop_changes = self._update_properties(pom_content)
-            changes.extend(prop_changes)
+            # Update property versions (the java stage may have inserted compiler ones)
+            if has_properties or has_boot_property or b'<project.build.sourceEncoding>' in pom_content:
+                pom_content, prop_changes = self._update_properties(pom_content)
+                changes.extend(prop_changes)
 
             # Update Spring Boot Maven Plugin version
-            pom_content, plugin_changes = self._update_maven_plugins(pom_content)
-            changes.extend(plugin_changes)
+            if has_plugins:
+                pom_content, plugin_changes = self._update_maven_plugins(pom_content)
+                changes.extend(plugin_changes)
 
             # Write updated content if there are actual changes
             if pom_content != original_content:
                 # Add modernization comment ONLY if we're making changes
                 pom_content = self._add_modernization_comment_internal(pom_content)
                 
-                with open(pom_path, 'w', encoding='utf-8') as f:
-                    f.write(pom_content)
+                write_atomic(output_path or pom_path, pom_content)
                 logger.info(f"Updated pom.xml: {len(changes)} changes made")
                 return True, f"Successfully updated pom.xml with {len(changes)} changes", changes
             else:
                 # No changes needed - don't touch the file at all
+                if output_path:
+                    write_atomic(output_path, content)
                 logger.info("No changes needed in pom.xml")
                 return True, "pom.xml is already up to date", []
 
@@ -126,180 +252,187 @@ class PomUpdater:
             logger.error(error_msg)
             return False, error_msg, []
 
-    def _update_parent_version(self, content: str) -> Tuple[str, List[str]]:
+    def update_many(
+        self,
+        pom_paths: List[str],
+        max_workers: Optional[int] = None
+    ) -> List[Tuple[bool, str, List[str]]]:
+        """
+        Update many pom.xml files, spreading them over worker processes
+        
+        Each pom is independent and the rewrite is CPU-bound regex work, so
+        worker processes sidestep the GIL; the module's compiled patterns load
+        once per worker. Runs inline for a single pom or a single CPU.
+        Returns: update_pom_xml results aligned with pom_paths
+        """
+        if not pom_paths:
+            return []
+        
+        workers = min(max_workers or os.cpu_count() or 1, len(pom_paths))
+        if workers < 2:
+            return [self.update_pom_xml(pom_path) for pom_path in pom_paths]
+        
+        chunksize = max(1, len(pom_paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=worker_context()) as executor:
+            return list(executor.map(self.update_pom_xml, pom_paths, chunksize=chunksize))
+
+    def _update_parent_version(self, content: bytes) -> Tuple[bytes, List[str]]:
         """Update Spring Boot starter-parent version in <parent> section"""
         changes = []
         
         # Match the entire parent section and update version for spring-boot-starter-parent
         # Pattern: <parent>...<artifactId>spring-boot-starter-parent</artifactId>...<version>X.X.X</version>...</parent>
-        parent_pattern = r'(<parent>.*?<artifactId>spring-boot-starter-parent</artifactId>.*?<version>)([0-9\.]+)(\.RELEASE)?</version>'
-        
-        if re.search(parent_pattern, content, re.DOTALL):
-            content = re.sub(
-                parent_pattern,
-                r'\g<1>3.2.0</version>',
-                content,
-                flags=re.DOTALL
-            )
+        content, count = _PARENT_VERSION_RE.subn(rb'\g<1>3.2.0</version>', content)
+        if count:
             changes.append("Updated parent spring-boot-starter-parent version to 3.2.0")
         
         return content, changes
 
-    def _update_java_version(self, content: str) -> Tuple[str, List[str]]:
+    def _update_java_version(self, content: bytes) -> Tuple[bytes, List[str]]:
         """Update Java version to 21"""
         changes = []
+        edits = []
         
         # Update <java.version>
-        pattern = r'<java\.version>.*?</java\.version>'
-        if re.search(pattern, content):
-            content = re.sub(pattern, '<java.version>21</java.version>', content)
+        for match in _JAVA_VERSION_RE.finditer(content):
+            edits.append((match.start(), match.end(), b'<java.version>21</java.version>'))
+        if edits:
             changes.append("Updated java.version to 21")
 
-        # Update <maven.compiler.source>
-        pattern = r'<maven\.compiler\.source>.*?</maven\.compiler\.source>'
-        if re.search(pattern, content):
-            content = re.sub(pattern, '<maven.compiler.source>21</maven.compiler.source>', content)
-            changes.append("Updated maven.compiler.source to 21")
-        else:
-            # Add if not present
-            insert_pos = content.find('</properties>')
-            if insert_pos > 0:
-                content = content[:insert_pos] + '\n        <maven.compiler.source>21</maven.compiler.source>' + content[insert_pos:]
-                changes.append("Added maven.compiler.source property (21)")
-
-        # Update <maven.compiler.target>
-        pattern = r'<maven\.compiler\.target>.*?</maven\.compiler\.target>'
-        if re.search(pattern, content):
-            content = re.sub(pattern, '<maven.compiler.target>21</maven.compiler.target>', content)
-            changes.append("Updated maven.compiler.target to 21")
-        else:
-            # Add if not present
-            insert_pos = content.find('</properties>')
+        # Update <maven.compiler.source> and <maven.compiler.target>
+        insert_pos = None
+        inserted = []
+        for pattern, tag, updated_message, added_message in _COMPILER_PROPERTIES:
+            found = False
+            for match in pattern.finditer(content):
+                edits.append((match.start(), match.end(), tag))
+                found = True
+            if found:
+                changes.append(updated_message)
+                continue
+            
+            # Add if not present; </properties> is only looked up when needed
+            if insert_pos is None:
+                insert_pos = content.find(b'</properties>')
             if insert_pos > 0:
-                content = content[:insert_pos] + '\n        <maven.compiler.target>21</maven.compiler.target>' + content[insert_pos:]
-                changes.append("Added maven.compiler.target property (21)")
+                inserted.append(b'\n        ' + tag)
+                changes.append(added_message)
+        
+        # Missing properties go in as one block before the first </properties>
+        if inserted:
+            edits.append((insert_pos, insert_pos, b''.join(inserted)))
 
-        return content, changes
+        return _splice(content, edits), changes
 
-    def _update_spring_boot_version(self, content: str) -> Tuple[str, List[str]]:
-        """Update Spring Boot version to 3.x"""
+    def _update_spring_boot_version(self, content: bytes) -> Tuple[bytes, List[str]]:
+        """Update Spring Boot version property to 3.x (_update_parent_version owns the parent)"""
         changes = []
         
-        # Update <parent><version> for Spring Boot parent
-        # Matches: <parent>...<version>2.x.x</version>...</parent>
-        pattern = r'(<parent>.*?<artifactId>spring-boot-starter-parent</artifactId>.*?<version>)[\d\.]+(.RELEASE)?</version>'
-        if re.search(pattern, content, re.DOTALL):
-            content = re.sub(
-                pattern,
-                r'\g<1>3.2.0</version>',
-                content,
-                flags=re.DOTALL
-            )
-            changes.append("Updated parent spring-boot-starter-parent version to 3.2.0")
-        
         # Update spring-boot.version property (if used)
-        pattern = r'<spring-boot\.version>.*?</spring-boot\.version>'
-        if re.search(pattern, content):
-            content = re.sub(pattern, '<spring-boot.version>3.2.0</spring-boot.version>', content)
+        content, count = _BOOT_VERSION_PROPERTY_RE.subn(b'<spring-boot.version>3.2.0</spring-boot.version>', content)
+        if count:
             changes.append("Updated spring-boot.version property to 3.2.0")
 
         return content, changes
 
-    def _update_dependencies(self, content: str) -> Tuple[str, List[str]]:
+    def _update_dependencies(self, content: bytes) -> Tuple[bytes, List[str]]:
         """Update Spring Boot and framework dependency versions"""
         changes = []
         
-        # Update Spring Boot starter dependencies
-        for dep_name, new_version in self.DEPENDENCY_VERSIONS.items():
-            # Pattern for artifact ID match
-            patterns = [
-                # Match <version> tag after <artifactId>{dep_name}</artifactId>
-                rf'(<artifactId>{dep_name}</artifactId>\s*<version>).*?(</version>)',
-                # Alternative pattern with different spacing
-                rf'(<artifactId>\s*{dep_name}\s*</artifactId>\s*<version>).*?(</version>)',
-            ]
-            
-            for pattern in patterns:
-                matches = list(re.finditer(pattern, content))
-                if matches:
-                    for match in matches:
-                        old_version = match.group(0)
-                        new_dep = match.group(1) + new_version + match.group(2)
-                        content = content.replace(old_version, new_dep, 1)
-                        changes.append(f"Updated {dep_name} to {new_version}")
-                    break
+        # One split finds every managed dependency, padded spellings included,
+        # and leaves each match as its five groups between the untouched text.
+        # Swapping the old versions and counting the names are slice and
+        # C-level operations, so no Python code runs per match
+        pieces = _MANAGED_DEPENDENCY_RE.split(content)
+        if len(pieces) == 1:
+            return content, changes
+        
+        dep_names = pieces[2::6]
+        pieces[4::6] = map(_DEPENDENCY_VERSION_BYTES.__getitem__, dep_names)
+        content = b''.join(pieces)
+        
+        # Report in table order, as the per-dependency passes did
+        counts = Counter(dep_names)
+        for dep_name, message in _DEPENDENCY_MESSAGES:
+            changes.extend([message] * counts[dep_name])
 
         return content, changes
 
-    def _update_properties(self, content: str) -> Tuple[str, List[str]]:
+    def _update_properties(self, content: bytes) -> Tuple[bytes, List[str]]:
         """Update project properties"""
         changes = []
         
-        for prop_name, prop_value in self.PROPERTIES_UPDATES.items():
-            # Skip java.version as it's handled separately
-            if prop_name == 'java.version':
-                continue
-            
-            pattern = rf'<{prop_name}>.*?</{prop_name}>'
-            if re.search(pattern, content):
-                content = re.sub(pattern, f'<{prop_name}>{prop_value}</{prop_name}>', content)
-                changes.append(f"Updated property {prop_name} to {prop_value}")
+        # Kept as one pass per property: each pattern starts with its full
+        # "<name>" literal, which sre searches for far faster than the bare
+        # "<" an alternation of all properties would leave it
+        for pattern, replacement, message in _PROPERTY_TABLE:
+            content, count = pattern.subn(replacement, content)
+            if count:
+                changes.append(message)
 
         return content, changes
 
-    def _update_maven_plugins(self, content: str) -> Tuple[str, List[str]]:
+    def _update_maven_plugins(self, content: bytes) -> Tuple[bytes, List[str]]:
         """Update Spring Boot Maven Plugin version"""
         changes = []
+        edits = []
         
         # Update spring-boot-maven-plugin version
-        pattern = r'(<artifactId>spring-boot-maven-plugin</artifactId>\s*<version>).*?(</version>)'
-        if re.search(pattern, content):
-            content = re.sub(pattern, r'\g<1>3.2.0\2', content)
+        found = False
+        for match in _BOOT_PLUGIN_RE.finditer(content):
+            edits.append((match.end(1), match.start(2), b'3.2.0'))
+            found = True
+        if found:
             changes.append("Updated spring-boot-maven-plugin to 3.2.0")
 
-        # Update maven-compiler-plugin
-        pattern = r'(<artifactId>maven-compiler-plugin</artifactId>\s*(?:<version>.*?</version>)?)'
-        if '<version>' not in re.search(pattern, content).group(0) if re.search(pattern, content) else False:
-            # Add version if not present
-            pattern = r'(<artifactId>maven-compiler-plugin</artifactId>)'
-            content = re.sub(pattern, r'\1\n                <version>3.11.0</version>', content)
+        # Add a version to every maven-compiler-plugin declared without one
+        found = False
+        for match in _COMPILER_PLUGIN_RE.finditer(content):
+            if match.group('version') is None:
+                edits.append((match.end(), match.end(), b'\n                <version>3.11.0</version>'))
+                found = True
+        if found:
             changes.append("Added maven-compiler-plugin version 3.11.0")
 
         # Update maven-surefire-plugin
-        pattern = r'(<artifactId>maven-surefire-plugin</artifactId>\s*<version>).*?(</version>)'
-        if re.search(pattern, content):
-            content = re.sub(pattern, r'\g<1>3.1.2\2', content)
+        found = False
+        for match in _SUREFIRE_PLUGIN_RE.finditer(content):
+            edits.append((match.end(1), match.start(2), b'3.1.2'))
+            found = True
+        if found:
             changes.append("Updated maven-surefire-plugin to 3.1.2")
 
-        return content, changes
+        # The three plugins never overlap, so one splice covers them all
+        return _splice(content, edits), changes
 
-    def _add_modernization_comment_internal(self, content: str) -> str:
-        """Add modernization comment to content string (internal use during update)"""
+    def _add_modernization_comment_internal(self, content: bytes) -> bytes:
+        """Add modernization comment to content bytes (internal use during update)"""
         # Check if comment already exists
-        if 'MODERNIZED by SpringLift' in content:
+        if b'MODERNIZED by SpringLift' in content:
             return content
         
-        # Add comment after XML declaration
-        comment = '\n<!-- MODERNIZED by SpringLift v2.1.1 - Updated to Java 21 and Spring Boot 3.x -->\n'
-        content = content.replace('?>\n', '?>' + comment, 1)
-        return content
+        # Add comment after XML declaration; it can only be in the prolog, so
+        # the pom body is never searched for it
+        end = content.find(b'?>\n', 0, _PROLOG_SCAN_LIMIT)
+        if end == -1:
+            return content
+        end += len(b'?>')
+        return content[:end] + _MODERNIZATION_COMMENT + content[end + 1:]
 
     def add_modernization_comment(self, pom_path: str) -> bool:
         """Add a comment noting this was modernized (only call if file was modified separately)"""
         try:
-            with open(pom_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            with open(pom_path, 'rb') as f:
+                content = _normalize_newlines(f.read())
             
             # Check if comment already exists
-            if 'MODERNIZED by SpringLift' in content:
+            if b'MODERNIZED by SpringLift' in content:
                 return True
             
             # Add comment after XML declaration
-            comment = '\n<!-- MODERNIZED by SpringLift v2.1.1 - Updated to Java 21 and Spring Boot 3.x -->\n'
-            content = content.replace('?>\n', '?>' + comment, 1)
+            content = self._add_modernization_comment_internal(content)
             
-            with open(pom_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            write_atomic(pom_path, content)
             
             logger.info(f"Added modernization comment to {pom_path}")
             return True
@@ -317,39 +450,46 @@ class PomUpdater:
         }
         
         try:
-            with open(pom_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extract project name
-            match = re.search(r'<artifactId>(.*?)</artifactId>', content)
-            if match:
-                info['project_name'] = match.group(1)
-            
-            # Extract Java version
-            match = re.search(r'<java\.version>(.*?)</java\.version>', content)
-            if match:
-                info['current_java_version'] = match.group(1)
-            else:
-                match = re.search(r'<maven\.compiler\.source>(.*?)</maven\.compiler\.source>', content)
+            # The pom is scanned in place through a read-only map, so only
+            # the extracted values are ever copied out of it
+            with mapped_file(pom_path) as content:
+                # Extract project name
+                match = _ARTIFACT_ID_VALUE_RE.search(content)
                 if match:
-                    info['current_java_version'] = match.group(1)
-            
-            # Extract Spring Boot version
-            match = re.search(r'<spring-boot\.version>(.*?)</spring-boot\.version>', content)
-            if match:
-                info['current_spring_boot_version'] = match.group(1)
-            else:
-                match = re.search(r'<version>(\d+\.\d+\.\d+)</version>\s*\n\s*</parent>', content)
+                    info['project_name'] = _text(match.group(1))
+                
+                # Extract Java version
+                match = _JAVA_VERSION_VALUE_RE.search(content)
                 if match:
-                    info['current_spring_boot_version'] = match.group(1)
-            
-            # Extract dependencies
-            dep_pattern = r'<artifactId>(.*?)</artifactId>\s*<version>(.*?)</version>'
-            for match in re.finditer(dep_pattern, content):
-                info['dependencies'].append({
-                    'name': match.group(1),
-                    'version': match.group(2)
-                })
+                    info['current_java_version'] = _text(match.group(1))
+                else:
+                    match = _COMPILER_SOURCE_VALUE_RE.search(content)
+                    if match:
+                        info['current_java_version'] = _text(match.group(1))
+                
+                # Extract Spring Boot version
+                match = _BOOT_VERSION_VALUE_RE.search(content)
+                if match:
+                    info['current_spring_boot_version'] = _text(match.group(1))
+                else:
+                    # Only the <parent> block can hold the parent version, so the
+                    # <version>-anchored pattern runs there instead of over every
+                    # dependency's <version>
+                    parent_end = content.find(b'</parent>')
+                    if parent_end != -1:
+                        parent_start = max(content.rfind(b'<parent>', 0, parent_end), 0)
+                        match = _PARENT_TAIL_VERSION_RE.search(
+                            content, parent_start, parent_end + len(b'</parent>')
+                        )
+                        if match:
+                            info['current_spring_boot_version'] = _text(match.group(1))
+                
+                # Extract dependencies; findall hands back plain (name, version)
+                # tuples, so no match object is built per dependency
+                info['dependencies'] = [
+                    {'name': _text(name), 'version': _text(version)}
+                    for name, version in _DEPENDENCY_VERSION_RE.findall(content)
+                ]
             
             return info
         except Exception as e:
@@ -357,5 +497,38 @@ class PomUpdater:
             return info
 
 
+# Every managed <artifactId> followed by its <version>, in one alternation that
+# keeps the shared "<artifactId>" literal prefix. Every part of a match is a
+# group so split() returns it whole: 1 = up to the name, 2 = name, 3 = up to
+# the version, 4 = old version text, 5 = </version>
+_MANAGED_DEPENDENCY_RE = re.compile(
+    rb'(<artifactId>\s*)('
+    + b'|'.join(re.escape(dep.encode()) for dep in sorted(PomUpdater.DEPENDENCY_VERSIONS, key=len, reverse=True))
+    + rb')(\s*</artifactId>\s*<version>)([^<]*)(</version>)'
+)
+_DEPENDENCY_VERSION_BYTES = {
+    dep_name.encode(): new_version.encode()
+    for dep_name, new_version in PomUpdater.DEPENDENCY_VERSIONS.items()
+}
+
+# Change messages in table order, so reporting does no formatting per update
+_DEPENDENCY_MESSAGES = tuple(
+    (dep_name.encode(), f"Updated {dep_name} to {new_version}")
+    for dep_name, new_version in PomUpdater.DEPENDENCY_VERSIONS.items()
+)
+
+# (pattern, replacement, message) per property, built from the class table once.
+# java.version is left out because _update_java_version owns it
+_PROPERTY_TABLE = tuple(
+    (
+        re.compile(rf'<{re.escape(prop_name)}>[^<]*</{re.escape(prop_name)}>'.encode()),
+        f'<{prop_name}>{prop_value}</{prop_name}>'.encode(),
+        f"Updated property {prop_name} to {prop_value}",
+    )
+    for prop_name, prop_value in PomUpdater.PROPERTIES_UPDATES.items()
+    if prop_name != 'java.version'
+)
+
+
 # Global instance
 pom_updater = PomUpdater()
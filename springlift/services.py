@@ -1,7 +1,16 @@
+import asyncio
+import hashlib
 import os
 import shutil
+import sqlite3
+import stat
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from .models import ScanRequest, ScanResult, ProjectAnalysis, FileAnalysis
 from .java_modernizer import java_modernizer
 from .logger import logger
@@ -10,9 +19,541 @@ from .diff_report import diff_report_generator
 from .report_generator import html_report_generator
 from .pom_updater import pom_updater
 from .gradle_updater import gradle_updater
+from ._process import worker_context
 import json
 
 
+# copy_file_range is Linux-only (Python 3.8+); elsewhere copies go through shutil
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+
+# Files per worker round trip, so pickling/IPC cost is paid per chunk, not per file
+_ANALYSIS_CHUNKSIZE = 8
+
+# Fresh analysis pools tried after a worker dies before the remaining files are
+# reported as failed; they are never analyzed in the server process itself
+_ANALYSIS_POOL_RETRIES = 1
+
+# Most AI requests in flight at once per scan, to stay inside provider rate limits
+_AI_MAX_CONCURRENCY = 8
+
+# Instructions shared by every analysis request. They come first and never
+# vary per file, so the providers' prompt caches can reuse the prefix (OpenAI
+# caches automatically past 1024 tokens; Anthropic via cache_control)
+_ANALYSIS_SYSTEM_PROMPT = """You are an expert Java developer specializing in modernizing legacy code.
+
+You will be given one or more Java source files. Analyze each file on its own and provide specific modernization recommendations for upgrading from Java 8/11 with Spring Boot 2.x to Java 21 with Spring Boot 3.x.
+
+Focus on:
+1. Deprecated Java APIs and their modern replacements
+2. Spring Boot 2.x to 3.x migration issues (especially javax -> jakarta)
+3. Modern Java 21 features that could be applied
+4. Performance improvements
+5. Code quality improvements
+
+Be concise and actionable. Only report findings that apply to the code you were given; do not list generic advice for APIs a file does not use. Refer to the relevant class, method or line when you can.
+
+Migration guidance to apply:
+
+Jakarta EE namespace
+- Spring Boot 3 is built on Jakarta EE 9+. Imports from javax.persistence, javax.validation, javax.servlet, javax.annotation (PostConstruct, PreDestroy, Resource), javax.transaction, javax.inject, javax.ws.rs, javax.mail and javax.jms must move to the matching jakarta.* package.
+- javax.sql, javax.crypto, javax.net, javax.security.auth and other JDK packages stay under javax; do not flag them.
+- Hibernate 6 ships with Spring Boot 3: flag custom dialects, @Type(type = "...") string references, and Criteria API code relying on removed Hibernate 5 APIs.
+
+Spring Framework 6 and Spring Boot 3
+- WebSecurityConfigurerAdapter was removed; configuration must expose a SecurityFilterChain bean. authorizeRequests(), antMatchers(), mvcMatchers() and regexMatchers() are replaced by authorizeHttpRequests() and requestMatchers().
+- Trailing slash matching is disabled by default; endpoints relying on "/path/" matching "/path" need explicit mappings.
+- Spring Cloud Sleuth is replaced by Micrometer Tracing; RestTemplate remains supported but RestClient or WebClient are preferred for new code.
+- Constructor injection is preferred over field injection with @Autowired; a single constructor needs no @Autowired annotation.
+- @ConstructorBinding is only needed on a type when it has more than one constructor.
+- Configuration properties that were renamed or removed (for example spring.redis.* moving to spring.data.redis.*) should be called out when referenced in code via @Value.
+- spring.factories auto-configuration registration moved to META-INF/spring/org.springframework.boot.autoconfigure.AutoConfiguration.imports.
+
+Java language and library upgrades (Java 8/11 to 21)
+- Records for immutable data carriers with only final fields, a canonical constructor, accessors, equals, hashCode and toString.
+- Sealed classes and interfaces for closed hierarchies.
+- Pattern matching for instanceof, and pattern matching and record patterns in switch, to remove explicit casts.
+- Switch expressions with arrow labels instead of fall-through statement switches.
+- Text blocks for multi-line SQL, JSON, XML or HTML string literals.
+- var for local variables whose type is obvious from the initializer; never for fields, parameters or return types.
+- Stream.toList() instead of collect(Collectors.toList()) when an unmodifiable result is acceptable.
+- List.of, Set.of and Map.of for small immutable collections instead of Arrays.asList or Collections.unmodifiable* wrappers.
+- Optional improvements: orElseThrow(), isEmpty(), ifPresentOrElse(), or().
+- String methods: isBlank(), strip(), lines(), repeat(), formatted().
+- Sequenced collections: getFirst(), getLast(), reversed() on List, Deque and LinkedHashMap/LinkedHashSet.
+- Virtual threads (Executors.newVirtualThreadPerTaskExecutor(), spring.threads.virtual.enabled) for blocking I/O-bound work that currently uses large fixed thread pools.
+- java.time instead of java.util.Date, Calendar and SimpleDateFormat.
+- HttpClient (java.net.http) instead of HttpURLConnection.
+
+Deprecated and removed APIs
+- new Integer(...), new Long(...), new Double(...), new Boolean(...) and other boxing constructors are deprecated for removal; use valueOf or autoboxing.
+- Thread.stop(), Thread.suspend(), Thread.resume(), Runtime.runFinalizersOnExit() and finalize() overrides are deprecated or removed; finalizers should become Cleaner or try-with-resources.
+- The Security Manager is deprecated for removal.
+- Nashorn (javax.script with the "nashorn" engine) was removed in Java 15.
+- JAXB, JAX-WS, javax.activation and CORBA were removed from the JDK in Java 11 and now need explicit dependencies.
+- sun.misc.Unsafe and other internal sun.* APIs are strongly encapsulated since Java 17.
+
+Performance
+- Flag string concatenation in loops, boxed numeric types in hot loops, synchronized collections where concurrent ones fit, N+1 query patterns in JPA repositories, and eager fetching of large associations.
+- Prefer try-with-resources for every AutoCloseable.
+
+Code quality
+- Flag empty catch blocks, catching Exception or Throwable without rethrowing, raw generic types, public mutable fields, and System.out/System.err logging instead of a logger.
+
+Provide each file's analysis in this JSON format, with each entry a short, specific string:
+{
+    "critical_issues": [],
+    "modernization_opportunities": [],
+    "performance_improvements": [],
+    "code_quality_suggestions": []
+}
+"""
+
+# Smallest scan sent through a provider Batch API when batching is enabled,
+# and how batch jobs are polled
+_AI_BATCH_MIN_FILES = 20
+_AI_BATCH_POLL_SECONDS = 10
+_AI_BATCH_TIMEOUT_SECONDS = 4 * 60 * 60
+
+# Answer budget per analyzed file
+_AI_MAX_TOKENS = 500
+
+# Attempts the provider SDKs make on 429/5xx/connection errors, with their own
+# exponential backoff and jitter (honouring Retry-After)
+_AI_MAX_RETRIES = 6
+
+
+def _env_int(name: str, default: int) -> int:
+    """
+    Integer setting from the environment, read at import
+    
+    A malformed value is logged and ignored rather than failing the import
+    of the whole app.
+    Returns: the parsed value, or default when unset or malformed
+    """
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Ignoring {name}={value!r}: not an integer; using {default}")
+        return default
+
+
+# Provider budgets per minute, kept below proactively rather than by hitting 429s
+_AI_REQUESTS_PER_MINUTE = _env_int("SPRINGLIFT_AI_RPM", 500)
+_AI_TOKENS_PER_MINUTE = _env_int("SPRINGLIFT_AI_TPM", 200000)
+
+# Rough characters per token, for budgeting without a tokenizer
+_CHARS_PER_TOKEN = 4
+
+# Small files are sent several to a request, up to this much code and this many
+# files, so the instructions and per-request overhead are paid once per group
+_AI_PACK_MAX_CHARS = 8000
+_AI_PACK_MAX_FILES = 8
+
+# Lead-in for a request that carries several files; the system prompt is
+# worded for one or more files, so it holds for packed and single requests alike
+_PACKED_PROMPT_HEADER = """This message contains {count} Java files, numbered below. Analyze each file on its own and reply with a single JSON object whose keys are the file numbers ("1", "2", ...) and whose values are that file's analysis in the JSON format above.
+"""
+
+
+def _pack_files(sizes: List[int], max_chars: int = _AI_PACK_MAX_CHARS, max_files: int = _AI_PACK_MAX_FILES) -> List[List[int]]:
+    """
+    Group items into bins of at most max_chars total size and max_files items
+    
+    First-fit decreasing: the largest items are placed first, each into the
+    first bin with room, so small files fill the gaps. Items larger than
+    max_chars get a bin of their own.
+    
+    Returns: bins of indices into sizes
+    """
+    bins: List[List[int]] = []
+    room: List[int] = []
+    for index in sorted(range(len(sizes)), key=sizes.__getitem__, reverse=True):
+        size = sizes[index]
+        for slot, free in enumerate(room):
+            if size <= free and len(bins[slot]) < max_files:
+                bins[slot].append(index)
+                room[slot] = free - size
+                break
+        else:
+            bins.append([index])
+            room.append(max_chars - size)
+    return bins
+
+
+def _split_packed_answer(answer: Optional[str], count: int) -> List[Optional[str]]:
+    """
+    Per-file answers from the reply to a packed request
+    
+    The reply should be a JSON object keyed "1".."count"; it may be wrapped
+    in a Markdown code fence. Files the reply does not cover come back as None.
+    
+    Returns: one answer (JSON text) or None per packed file, in prompt order
+    """
+    answers: List[Optional[str]] = [None] * count
+    if not answer:
+        return answers
+    start, end = answer.find("{"), answer.rfind("}")
+    try:
+        parsed = json.loads(answer[start:end + 1]) if 0 <= start < end else None
+    except ValueError:
+        parsed = None
+    if not isinstance(parsed, dict):
+        return answers
+    for number in range(count):
+        value = parsed.get(str(number + 1))
+        if value:
+            answers[number] = json.dumps(value, indent=4)
+    return answers
+
+
+@lru_cache(maxsize=None)
+def _analysis_pool() -> ProcessPoolExecutor:
+    """Process pool shared by every scan, created on first use, without forking the server"""
+    return ProcessPoolExecutor(max_workers=os.cpu_count() or 1, mp_context=worker_context())
+
+
+def _map_on_analysis_pool(worker, items: List) -> List:
+    """
+    worker over items on the shared analysis pool, in order
+    
+    worker follows _try_modernize_java_file's (result, error) convention.
+    A worker process that dies (out of memory, a crash) breaks the whole
+    pool. The broken pool is dropped and the items without a result yet are
+    retried on a fresh one, one per task; if that pool breaks too, they are
+    reported as failed. They are never run in this process, where the same
+    input could take down the server.
+    
+    Returns: (result, error) pairs aligned with items
+    """
+    results = []
+    chunksize = _ANALYSIS_CHUNKSIZE
+    for _ in range(_ANALYSIS_POOL_RETRIES + 1):
+        pool = _analysis_pool()
+        try:
+            for result in pool.map(worker, items[len(results):], chunksize=chunksize):
+                results.append(result)
+            return results
+        except BrokenProcessPool as e:
+            logger.warning(f"Analysis process pool failed ({str(e)}) with {len(items) - len(results)} files left")
+            _analysis_pool.cache_clear()
+            pool.shutdown(wait=False, cancel_futures=True)
+            chunksize = 1
+    
+    error = "analysis worker process terminated abruptly"
+    results.extend((None, error) for _ in items[len(results):])
+    return results
+
+
+@lru_cache(maxsize=None)
+def _io_pool() -> ThreadPoolExecutor:
+    """
+    Thread pool for directory listings and file copies, created on first use
+    
+    That work waits on the filesystem rather than the CPU (most of all on
+    network mounts), so it gets more threads than there are cores.
+    """
+    return ThreadPoolExecutor(max_workers=16, thread_name_prefix="springlift-io")
+
+
+def _scan_dir(path: str) -> Tuple[List[str], List[str], List[str]]:
+    """
+    List one directory of a project, skipping *_modernized output directories
+    
+    Unreadable directories are skipped, as os.walk does. Symlinked
+    directories are neither descended into nor listed as files, matching
+    os.walk's default.
+    
+    Returns: (Java file paths, other file paths, subdirectory paths)
+    """
+    java_files, other_files, subdirs = [], [], []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not (entry.is_symlink() or entry.name.endswith("_modernized")):
+                        subdirs.append(entry.path)
+                elif entry.name.endswith(".java"):
+                    java_files.append(entry.path)
+                else:
+                    other_files.append(entry.path)
+    except OSError:
+        pass
+    return java_files, other_files, subdirs
+
+
+def _walk_project(project_path: str) -> Tuple[List[str], List[str]]:
+    """
+    Find every file under project_path, one directory level at a time
+    
+    All directories of a level are listed concurrently on the I/O pool, so
+    on latency-bound filesystems the listings overlap instead of queueing.
+    Runs inline on a single CPU.
+    
+    Returns: (Java file paths, other file paths)
+    """
+    scan = _io_pool().map if (os.cpu_count() or 1) > 1 else map
+    java_files, other_files = [], []
+    level = [project_path]
+    while level:
+        next_level = []
+        for level_java, level_other, subdirs in scan(_scan_dir, level):
+            java_files.extend(level_java)
+            other_files.extend(level_other)
+            next_level.extend(subdirs)
+        level = next_level
+    return java_files, other_files
+
+
+def _file_names(path: str) -> set:
+    """
+    Names of the regular files directly in path, from one directory read
+    
+    Returns: set of file names (empty if path is missing or unreadable)
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
+
+
+def _copy_contents(src_file: str, dst_file: str) -> int:
+    """
+    Copy one file's bytes inside the kernel
+    
+    Uses os.copy_file_range, which also clones extents on copy-on-write
+    filesystems (btrfs, XFS with reflink), and falls back to
+    shutil.copyfile (sendfile-based on Linux) where it is missing or the
+    filesystems refuse it.
+    
+    Returns: the source file's mode bits
+    """
+    with open(src_file, "rb") as src, open(dst_file, "wb") as dst:
+        st = os.fstat(src.fileno())
+        if _HAS_COPY_FILE_RANGE:
+            remaining = st.st_size
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if not copied:
+                        break
+                    remaining -= copied
+                return stat.S_IMODE(st.st_mode)
+            except OSError:
+                # EXDEV, ENOSYS, EINVAL...: let shutil pick a path below
+                pass
+    shutil.copyfile(src_file, dst_file)
+    return stat.S_IMODE(st.st_mode)
+
+
+def _copy_file(src_file: str, dst_file: str) -> None:
+    """
+    Copy one file with its permission bits, logging instead of raising on failure
+    
+    Timestamps are not carried over: the output tree is a fresh copy and
+    nothing downstream reads them.
+    """
+    try:
+        os.chmod(dst_file, _copy_contents(src_file, dst_file))
+    except Exception as e:
+        logger.warning(f"Could not copy {src_file}: {str(e)}")
+
+
+def _modernize_java_file(
+    file_path: str,
+    project_path: str,
+    output_path: str,
+    keep_content: bool,
+    timestamp: str
+) -> Tuple[str, Dict, Optional[str]]:
+    """
+    Analyze one Java file and write its modernized copy under output_path
+    
+    Runs in a worker process, so it only touches module-level state.
+    
+    Returns: (relative path, static analysis, original content if keep_content)
+    """
+    # Most Java sources are pure ASCII: check that in one pass and decode
+    # without the UTF-8 error-handling machinery
+    with open(file_path, "rb") as f:
+        data = f.read()
+    content = data.decode("ascii") if data.isascii() else data.decode("utf-8", errors="ignore")
+    if b"\r" in data:
+        # Same universal-newline translation text mode applied
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+    filename = os.path.basename(file_path)
+    analysis, modernized_content = java_modernizer.analyze_and_modernize(content, filename, timestamp)
+
+    relative_path = os.path.relpath(file_path, project_path)
+    new_file_path = os.path.join(output_path, relative_path)
+    os.makedirs(os.path.dirname(new_file_path), exist_ok=True)
+    
+    with open(new_file_path, "w", encoding="utf-8") as f:
+        f.write(modernized_content)
+
+    return relative_path, analysis, content if keep_content else None
+
+
+def _try_modernize_java_file(file_path: str, **kwargs) -> Tuple[Optional[Tuple[str, Dict, Optional[str]]], Optional[str]]:
+    """
+    _modernize_java_file that reports failure instead of raising, so one bad
+    file does not abort a chunked pool.map over the rest
+    
+    Returns: (_modernize_java_file result, None), or (None, error message)
+    """
+    try:
+        return _modernize_java_file(file_path, **kwargs), None
+    except Exception as e:
+        return None, str(e)
+
+
+class _RateLimiter:
+    """
+    Token bucket holding at most one minute's budget, shared by every thread
+    and event loop of the process
+    
+    reserve() always takes its cost, running the bucket into debt if needed,
+    and tells the caller how long to wait for that debt to refill, so
+    callers never need to hold a lock while they sleep.
+    """
+    
+    def __init__(self, per_minute: int):
+        self.capacity = max(1, per_minute)
+        self.rate = self.capacity / 60.0
+        self._level = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, cost: float) -> float:
+        """
+        Take cost from the bucket
+        
+        Returns: seconds to wait before spending it
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._level = min(self.capacity, self._level + (now - self._updated) * self.rate)
+            self._updated = now
+            self._level -= min(cost, self.capacity)
+            return 0.0 if self._level >= 0 else -self._level / self.rate
+
+
+_request_limiter = _RateLimiter(_AI_REQUESTS_PER_MINUTE)
+_token_limiter = _RateLimiter(_AI_TOKENS_PER_MINUTE)
+
+
+def _rate_limit_delay(prompt: str, max_tokens: int) -> float:
+    """
+    Reserve one request and its estimated tokens (prompt plus answer budget)
+    
+    Returns: seconds to wait before sending the request
+    """
+    tokens = (len(_ANALYSIS_SYSTEM_PROMPT) + len(prompt)) / _CHARS_PER_TOKEN + max_tokens
+    return max(_request_limiter.reserve(1), _token_limiter.reserve(tokens))
+
+
+# Bounds on the LLM response cache: answers older than the age limit are
+# dropped, then the oldest beyond the row limit; pruning runs on the first
+# write and every _LLM_CACHE_PRUNE_EVERY writes after it
+_LLM_CACHE_MAX_ROWS = _env_int("SPRINGLIFT_LLM_CACHE_MAX_ROWS", 50000)
+_LLM_CACHE_MAX_AGE_DAYS = _env_int("SPRINGLIFT_LLM_CACHE_MAX_AGE_DAYS", 30)
+_LLM_CACHE_PRUNE_EVERY = 100
+
+
+class _ResponseCache:
+    """
+    Persistent exact-match cache of LLM answers in SQLite, keyed by request digest
+    
+    Opened on first use; if the database cannot be opened or written the
+    cache logs once and turns itself off rather than failing the scan.
+    Holds at most max_rows answers, none older than max_age_days, so it
+    stays bounded in long-running deployments.
+    """
+    
+    def __init__(self, path: str, max_rows: int = _LLM_CACHE_MAX_ROWS,
+                 max_age_days: float = _LLM_CACHE_MAX_AGE_DAYS):
+        self.path = path
+        self.max_rows = max(1, max_rows)
+        self.max_age_seconds = max_age_days * 24 * 60 * 60
+        self._connection = None
+        self._disabled = not path
+        self._lock = threading.Lock()
+        self._puts = 0
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database on first use; callers hold self._lock"""
+        if self._connection is None and not self._disabled:
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                connection = sqlite3.connect(self.path, check_same_thread=False)
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS responses "
+                    "(key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)"
+                )
+                connection.execute("CREATE INDEX IF NOT EXISTS responses_created_at ON responses (created_at)")
+                connection.commit()
+                self._connection = connection
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"LLM response cache disabled ({self.path}): {str(e)}")
+                self._disabled = True
+        return self._connection
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached answer for key, or None"""
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                return None
+            try:
+                row = connection.execute(
+                    "SELECT response FROM responses WHERE key = ? AND created_at >= ?",
+                    (key, time.time() - self.max_age_seconds)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"LLM response cache lookup failed: {str(e)}")
+                return None
+            return row[0] if row else None
+
+    def put(self, key: str, response: str) -> None:
+        """Store the answer for key, pruning old and excess answers now and then"""
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                return
+            try:
+                now = time.time()
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, created_at) VALUES (?, ?, ?)",
+                    (key, response, now)
+                )
+                if self._puts % _LLM_CACHE_PRUNE_EVERY == 0:
+                    self._prune(connection, now)
+                self._puts += 1
+                connection.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"LLM response cache write failed: {str(e)}")
+
+    def _prune(self, connection: sqlite3.Connection, now: float) -> None:
+        """Drop expired answers, then the oldest beyond max_rows; callers hold self._lock"""
+        connection.execute("DELETE FROM responses WHERE created_at < ?", (now - self.max_age_seconds,))
+        connection.execute(
+            "DELETE FROM responses WHERE key IN "
+            "(SELECT key FROM responses ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_rows,)
+        )
+
+
+# Answers survive restarts, so re-scanning unchanged files costs no API calls;
+# set SPRINGLIFT_LLM_CACHE to another path, or to an empty string to disable it
+_response_cache = _ResponseCache(
+    os.getenv("SPRINGLIFT_LLM_CACHE", os.path.join(os.path.expanduser("~"), ".springlift", "llm_cache.sqlite"))
+)
+
+
 class LLMService:
     """
     Service for AI-powered code analysis using OpenAI or Anthropic
@@ -23,6 +564,9 @@ class LLMService:
         self.anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
         self.use_openai = bool(self.openai_api_key)
         self.use_anthropic = bool(self.anthropic_api_key)
+        # Batch jobs cost about half as much but may take hours, so they are
+        # only used when explicitly enabled for offline scans (/scan/async)
+        self.use_batch_api = os.getenv("SPRINGLIFT_AI_BATCH_API", "").lower() in ("1", "true", "yes")
 
     def analyze_code_with_ai(self, code: str, filename: str, provider: str = "openai") -> Optional[str]:
         """
@@ -35,60 +579,343 @@ class LLMService:
 
         try:
             if provider == "openai" and self.use_openai:
-                return self._analyze_with_openai(prompt)
+                analyze = self._analyze_with_openai
             elif provider == "anthropic" and self.use_anthropic:
-                return self._analyze_with_anthropic(prompt)
+                analyze = self._analyze_with_anthropic
             else:
                 logger.warning(f"AI provider {provider} not configured, skipping AI analysis")
                 return None
+            
+            key = self._cache_key(provider, prompt)
+            answer = _response_cache.get(key)
+            if answer is None:
+                answer = analyze(prompt)
+                if answer is not None:
+                    _response_cache.put(key, answer)
+            return answer
         except Exception as e:
             logger.error(f"AI analysis failed for {filename}: {str(e)}")
             return None
 
-    def _build_analysis_prompt(self, code: str, filename: str) -> str:
-        """Build the analysis prompt for LLM"""
-        return f"""You are an expert Java developer specializing in modernizing legacy code.
+    def analyze_many_with_ai(
+        self,
+        files: List[Tuple[str, str]],
+        provider: str = "openai",
+        max_concurrency: int = _AI_MAX_CONCURRENCY
+    ) -> List[Optional[str]]:
+        """
+        Analyze many (code, filename) pairs with the LLM concurrently
+        
+        Each call is a network round-trip, so the requests are issued together
+        on an event loop with at most max_concurrency in flight instead of
+        one blocking call per file, and small files share a request. With
+        SPRINGLIFT_AI_BATCH_API set, large scans go through the provider's
+        Batch API instead (see analyze_batch).
+        Answers already in the response cache are not requested again; a
+        packed request's reply is cached under that packed request, so only
+        an identical group of files reuses it.
+        
+        Returns: analyze_code_with_ai results aligned with files
+        """
+        if not files:
+            return []
+        if not ((provider == "openai" and self.use_openai) or (provider == "anthropic" and self.use_anthropic)):
+            logger.warning(f"AI provider {provider} not configured, skipping AI analysis")
+            return [None] * len(files)
 
-Analyze this Java file ({filename}) and provide specific modernization recommendations for upgrading from Java 8/11 with Spring Boot 2.x to Java 21 with Spring Boot 3.x.
+        results: List[Optional[str]] = [None] * len(files)
+        missing = []
+        for index, (code, filename) in enumerate(files):
+            if not code or len(code) < 10:
+                continue
+            key = self._cache_key(provider, self._build_analysis_prompt(code, filename))
+            results[index] = _response_cache.get(key)
+            if results[index] is None:
+                missing.append((index, key))
+        if not missing:
+            return results
 
-Focus on:
-1. Deprecated Java APIs and their modern replacements
-2. Spring Boot 2.x to 3.x migration issues (especially javax -> jakarta)
-3. Modern Java 21 features that could be applied
-4. Performance improvements
-5. Code quality improvements
+        # Each request path caches its answers under the request it actually sent
+        answers = self._analyze_uncached([files[index] for index, _ in missing], provider, max_concurrency)
+        for (index, _), answer in zip(missing, answers):
+            results[index] = answer
+        return results
+
+    def _analyze_uncached(
+        self,
+        files: List[Tuple[str, str]],
+        provider: str,
+        max_concurrency: int
+    ) -> List[Optional[str]]:
+        """Request AI analysis of every file, as one batch job or concurrent calls"""
+        if self.use_batch_api and len(files) >= _AI_BATCH_MIN_FILES:
+            return self.analyze_batch(files, provider)
+
+        coroutine = self._analyze_many_async(files, provider, max_concurrency)
+        try:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(coroutine)
+            # Already inside an event loop: run ours on a helper thread
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                return executor.submit(asyncio.run, coroutine).result()
+        except Exception as e:
+            logger.error(f"AI analysis failed: {str(e)}")
+            return [None] * len(files)
+
+    async def _analyze_many_async(
+        self,
+        files: List[Tuple[str, str]],
+        provider: str,
+        max_concurrency: int
+    ) -> List[Optional[str]]:
+        """
+        Run the AI analysis of every file on one async client, bounded by a semaphore
+        
+        Files are packed into requests of several small files each (see
+        _pack_files); a file missing from a packed reply is retried alone.
+        
+        Returns: analyze_code_with_ai results aligned with files
+        """
+        if provider == "openai":
+            from openai import AsyncOpenAI
+            client = AsyncOpenAI(api_key=self.openai_api_key, max_retries=_AI_MAX_RETRIES)
+            analyze = self._analyze_with_openai_async
+        else:
+            from anthropic import AsyncAnthropic
+            client = AsyncAnthropic(api_key=self.anthropic_api_key, max_retries=_AI_MAX_RETRIES)
+            analyze = self._analyze_with_anthropic_async
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def analyze_one(code: str, filename: str) -> Optional[str]:
+            prompt = self._build_analysis_prompt(code, filename)
+            async with semaphore:
+                try:
+                    answer = await analyze(client, prompt)
+                except Exception as e:
+                    logger.error(f"AI analysis failed for {filename}: {str(e)}")
+                    return None
+            if answer is not None:
+                _response_cache.put(self._cache_key(provider, prompt), answer)
+            return answer
+
+        async def analyze_group(group: List[int]) -> None:
+            if len(group) == 1:
+                results[group[0]] = await analyze_one(*files[group[0]])
+                return
+            prompt = self._build_packed_prompt([files[index] for index in group])
+            max_tokens = _AI_MAX_TOKENS * len(group)
+            key = self._cache_key(provider, prompt, max_tokens)
+            answer = _response_cache.get(key)
+            if answer is None:
+                async with semaphore:
+                    try:
+                        answer = await analyze(client, prompt, max_tokens=max_tokens)
+                    except Exception as e:
+                        logger.error(f"Packed AI analysis of {len(group)} files failed: {str(e)}")
+                if answer is not None:
+                    _response_cache.put(key, answer)
+            # Files the packed reply missed are asked about on their own
+            retry = []
+            for index, file_answer in zip(group, _split_packed_answer(answer, len(group))):
+                results[index] = file_answer
+                if file_answer is None:
+                    retry.append(index)
+            retried = await asyncio.gather(*(analyze_one(*files[index]) for index in retry))
+            for index, file_answer in zip(retry, retried):
+                results[index] = file_answer
 
-Be concise and actionable.
+        results: List[Optional[str]] = [None] * len(files)
+        pending = [index for index, (code, _) in enumerate(files) if code and len(code) >= 10]
+        groups = _pack_files([min(len(files[index][0]), 2000) for index in pending])
+        try:
+            await asyncio.gather(*(analyze_group([pending[slot] for slot in group]) for group in groups))
+            return results
+        finally:
+            await client.close()
+
+    def analyze_batch(
+        self,
+        files: List[Tuple[str, str]],
+        provider: str = "openai",
+        timeout: float = _AI_BATCH_TIMEOUT_SECONDS
+    ) -> List[Optional[str]]:
+        """
+        Analyze many (code, filename) pairs as one provider Batch API job
+        
+        All prompts are submitted in a single job (OpenAI /v1/batches or
+        Anthropic message batches) at roughly half the per-token price, then
+        the job is polled until it ends. A job still running after timeout
+        seconds is cancelled.
+        
+        The polling blocks the calling thread for as long as the job runs
+        (up to _AI_BATCH_TIMEOUT_SECONDS by default), and a scan that gets
+        here keeps its scan slot meanwhile, so batch scans belong on the
+        background /scan/async route rather than /scan.
+        
+        Returns: analyze_code_with_ai results aligned with files
+        """
+        results: List[Optional[str]] = [None] * len(files)
+        prompts = {
+            str(index): self._build_analysis_prompt(code, filename)
+            for index, (code, filename) in enumerate(files)
+            if code and len(code) >= 10
+        }
+        if not prompts:
+            return results
+
+        try:
+            if provider == "openai":
+                answers = self._run_openai_batch(prompts, timeout)
+            else:
+                answers = self._run_anthropic_batch(prompts, timeout)
+        except Exception as e:
+            logger.error(f"AI batch analysis failed: {str(e)}")
+            return results
+
+        for custom_id, answer in answers.items():
+            results[int(custom_id)] = answer
+            _response_cache.put(self._cache_key(provider, prompts[custom_id]), answer)
+        return results
+
+    def _run_openai_batch(self, prompts: Dict[str, str], timeout: float) -> Dict[str, str]:
+        """Submit prompts as an OpenAI batch job and collect the answers by custom_id"""
+        from openai import OpenAI
+        client = OpenAI(api_key=self.openai_api_key, max_retries=_AI_MAX_RETRIES)
+
+        requests_jsonl = "\n".join(
+            json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._openai_request(prompt)
+            })
+            for custom_id, prompt in prompts.items()
+        )
+        batch_file = client.files.create(file=("requests.jsonl", requests_jsonl.encode("utf-8")), purpose="batch")
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"Submitted OpenAI batch {batch.id} with {len(prompts)} requests")
+
+        deadline = time.monotonic() + timeout
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            if time.monotonic() > deadline:
+                client.batches.cancel(batch.id)
+                raise TimeoutError(f"OpenAI batch {batch.id} did not finish in {timeout}s")
+            time.sleep(_AI_BATCH_POLL_SECONDS)
+            batch = client.batches.retrieve(batch.id)
+
+        if not batch.output_file_id:
+            raise RuntimeError(f"OpenAI batch {batch.id} ended with status {batch.status}")
+
+        answers = {}
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") == 200:
+                answers[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        return answers
+
+    def _run_anthropic_batch(self, prompts: Dict[str, str], timeout: float) -> Dict[str, str]:
+        """Submit prompts as an Anthropic message batch and collect the answers by custom_id"""
+        from anthropic import Anthropic
+        client = Anthropic(api_key=self.anthropic_api_key, max_retries=_AI_MAX_RETRIES)
+
+        batch = client.messages.batches.create(requests=[
+            {"custom_id": custom_id, "params": self._anthropic_request(prompt)}
+            for custom_id, prompt in prompts.items()
+        ])
+        logger.info(f"Submitted Anthropic batch {batch.id} with {len(prompts)} requests")
+
+        deadline = time.monotonic() + timeout
+        while batch.processing_status != "ended":
+            if time.monotonic() > deadline:
+                client.messages.batches.cancel(batch.id)
+                raise TimeoutError(f"Anthropic batch {batch.id} did not finish in {timeout}s")
+            time.sleep(_AI_BATCH_POLL_SECONDS)
+            batch = client.messages.batches.retrieve(batch.id)
+
+        return {
+            entry.custom_id: entry.result.message.content[0].text
+            for entry in client.messages.batches.results(batch.id)
+            if entry.result.type == "succeeded"
+        }
+
+    def _cache_key(self, provider: str, prompt: str, max_tokens: int = _AI_MAX_TOKENS) -> str:
+        """Digest of the exact request a prompt turns into, so a model or parameter change misses"""
+        if provider == "openai":
+            request = self._openai_request(prompt, max_tokens)
+        else:
+            request = self._anthropic_request(prompt, max_tokens)
+        payload = json.dumps([provider, request], sort_keys=True).encode("utf-8", "surrogatepass")
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def _openai_request(self, prompt: str, max_tokens: int = _AI_MAX_TOKENS) -> Dict:
+        """Chat completion parameters for one analysis prompt"""
+        return {
+            "model": "gpt-4-turbo-preview",
+            "messages": [
+                {"role": "system", "content": _ANALYSIS_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.3,
+            "max_tokens": max_tokens
+        }
+
+    def _anthropic_request(self, prompt: str, max_tokens: int = _AI_MAX_TOKENS) -> Dict:
+        """Messages API parameters for one analysis prompt"""
+        return {
+            "model": "claude-3-opus-20240229",
+            "max_tokens": max_tokens,
+            "system": [
+                {"type": "text", "text": _ANALYSIS_SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}
+            ],
+            "messages": [
+                {"role": "user", "content": prompt}
+            ]
+        }
+
+    def _build_analysis_prompt(self, code: str, filename: str) -> str:
+        """Build the per-file part of the analysis prompt; the instructions are _ANALYSIS_SYSTEM_PROMPT"""
+        # First 2000 chars to keep prompt manageable
+        return f"""File: {filename}
 
-Code:
 ```java
-{code[:2000]}  // First 2000 chars to keep prompt manageable
+{code[:2000]}
 ```
-
-Provide analysis in this JSON format:
-{{
-    "critical_issues": [],
-    "modernization_opportunities": [],
-    "performance_improvements": [],
-    "code_quality_suggestions": []
-}}
 """
 
+    def _build_packed_prompt(self, files: List[Tuple[str, str]]) -> str:
+        """Build one prompt carrying several (code, filename) pairs, numbered from 1"""
+        parts = [_PACKED_PROMPT_HEADER.format(count=len(files))]
+        for number, (code, filename) in enumerate(files, 1):
+            parts.append(f"### File {number}")
+            parts.append(self._build_analysis_prompt(code, filename))
+        return "\n".join(parts)
+
     def _analyze_with_openai(self, prompt: str) -> Optional[str]:
         """Analyze using OpenAI API"""
         try:
             from openai import OpenAI
-            client = OpenAI(api_key=self.openai_api_key)
+            client = OpenAI(api_key=self.openai_api_key, max_retries=_AI_MAX_RETRIES)
             
-            response = client.chat.completions.create(
-                model="gpt-4-turbo-preview",
-                messages=[
-                    {"role": "system", "content": "You are a Java modernization expert."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=500
-            )
+            time.sleep(_rate_limit_delay(prompt, _AI_MAX_TOKENS))
+            response = client.chat.completions.create(**self._openai_request(prompt))
+            return response.choices[0].message.content
+        except Exception as e:
+            logger.error(f"OpenAI analysis failed: {str(e)}")
+            return None
+
+    async def _analyze_with_openai_async(self, client, prompt: str, max_tokens: int = _AI_MAX_TOKENS) -> Optional[str]:
+        """Analyze using an AsyncOpenAI client"""
+        try:
+            await asyncio.sleep(_rate_limit_delay(prompt, max_tokens))
+            response = await client.chat.completions.create(**self._openai_request(prompt, max_tokens))
             return response.choices[0].message.content
         except Exception as e:
             logger.error(f"OpenAI analysis failed: {str(e)}")
@@ -98,15 +925,20 @@ Provide analysis in this JSON format:
         """Analyze using Anthropic Claude API"""
         try:
             from anthropic import Anthropic
-            client = Anthropic(api_key=self.anthropic_api_key)
+            client = Anthropic(api_key=self.anthropic_api_key, max_retries=_AI_MAX_RETRIES)
             
-            message = client.messages.create(
-                model="claude-3-opus-20240229",
-                max_tokens=500,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
+            time.sleep(_rate_limit_delay(prompt, _AI_MAX_TOKENS))
+            message = client.messages.create(**self._anthropic_request(prompt))
+            return message.content[0].text
+        except Exception as e:
+            logger.error(f"Anthropic analysis failed: {str(e)}")
+            return None
+
+    async def _analyze_with_anthropic_async(self, client, prompt: str, max_tokens: int = _AI_MAX_TOKENS) -> Optional[str]:
+        """Analyze using an AsyncAnthropic client"""
+        try:
+            await asyncio.sleep(_rate_limit_delay(prompt, max_tokens))
+            message = await client.messages.create(**self._anthropic_request(prompt, max_tokens))
             return message.content[0].text
         except Exception as e:
             logger.error(f"Anthropic analysis failed: {str(e)}")
@@ -153,26 +985,16 @@ class GenAIService:
         java_files = self._find_java_files(request.project_path)
         logger.info(f"Found {len(java_files)} Java files")
 
-        for file_path in java_files:
-            try:
-                analysis = self._analyze_and_modernize_file(
-                    file_path, 
-                    request.project_path, 
-                    output_path,
-                    request.use_ai,
-                    request.ai_provider
-                )
-                file_analyses.append(analysis)
-                project_analysis.total_files_analyzed += 1
-                project_analysis.issues_found += len(analysis.issues)
-            except Exception as e:
-                logger.error(f"Error processing {file_path}: {str(e)}")
+        for analysis in self._analyze_java_files(java_files, request, output_path):
+            file_analyses.append(analysis)
+            project_analysis.total_files_analyzed += 1
+            project_analysis.issues_found += len(analysis.issues)
 
         # Scan for build files
-        self._analyze_build_files(request.project_path, project_analysis)
+        build_files = self._analyze_build_files(request.project_path, project_analysis)
 
         # Copy non-Java files
-        self._copy_non_java_files(request.project_path, output_path)
+        self._copy_non_java_files(request.project_path, output_path, build_files)
 
         # Compile results
         project_analysis.file_analyses = file_analyses
@@ -186,7 +1008,7 @@ class GenAIService:
         
         # Generate HTML report
         reports_dir = os.path.join(output_path, "reports")
-        if html_report_generator.generate_full_report(result.__dict__, reports_dir):
+        if html_report_generator.generate_full_report(result.model_dump(mode="json"), reports_dir):
             logger.info(f"HTML report generated at {reports_dir}")
 
         logger.info(f"Analysis complete. Output at: {output_path}")
@@ -194,72 +1016,87 @@ class GenAIService:
 
     def _find_java_files(self, project_path: str) -> list:
         """Find all .java files in the project"""
-        java_files = []
-        for root, dirs, files in os.walk(project_path):
-            # Skip output directories
-            dirs[:] = [d for d in dirs if not d.endswith("_modernized")]
-            
-            for file in files:
-                if file.endswith(".java"):
-                    java_files.append(os.path.join(root, file))
+        java_files, _ = _walk_project(project_path)
         return java_files
 
-    def _analyze_and_modernize_file(
+    def _analyze_java_files(
         self, 
-        file_path: str, 
-        project_path: str,
-        output_path: str,
-        use_ai: bool,
-        ai_provider: str
-    ) -> FileAnalysis:
-        """Analyze and modernize a single Java file"""
+        java_files: List[str], 
+        request: ScanRequest,
+        output_path: str
+    ) -> List[FileAnalysis]:
+        """
+        Analyze and modernize every Java file, spreading the regex work across processes
         
-        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-            content = f.read()
+        Static analysis is pure CPU and independent per file, so files go to
+        a shared process pool. AI analysis is network-bound and stays in
+        this process, with all files' requests issued concurrently once the
+        static pass is done. A file that fails is logged and skipped.
+        
+        Returns: FileAnalysis per processed file, in input order
+        """
+        worker = partial(
+            _try_modernize_java_file,
+            project_path=request.project_path,
+            output_path=output_path,
+            keep_content=request.use_ai,
+            # One header timestamp for the whole scan
+            timestamp=self.java_modernizer._get_timestamp()
+        )
+        if len(java_files) < 2 or (os.cpu_count() or 1) < 2:
+            outcomes = map(worker, java_files)
+        else:
+            outcomes = _map_on_analysis_pool(worker, java_files)
 
-        # Get static analysis
-        analysis = self.java_modernizer.analyze_java_file(content, os.path.basename(file_path))
+        file_analyses = []
+        contents = []
+        for file_path, (result, error) in zip(java_files, outcomes):
+            if error is not None:
+                logger.error(f"Error processing {file_path}: {error}")
+                continue
+            try:
+                relative_path, analysis, content = result
+                file_analyses.append(FileAnalysis(
+                    filename=os.path.basename(file_path),
+                    filepath=relative_path,
+                    issues=analysis["issues"],
+                    suggestions=analysis["suggestions"],
+                    transformations=analysis["transformations"]
+                ))
+                contents.append(content)
+            except Exception as e:
+                logger.error(f"Error processing {file_path}: {str(e)}")
 
         # Get AI analysis if enabled
-        ai_analysis = None
-        if use_ai:
-            ai_analysis = self.llm_service.analyze_code_with_ai(
-                content, 
-                os.path.basename(file_path),
-                ai_provider
+        if request.use_ai and file_analyses:
+            ai_analyses = self.llm_service.analyze_many_with_ai(
+                [(content, file_analysis.filename) for content, file_analysis in zip(contents, file_analyses)],
+                request.ai_provider
             )
+            for file_analysis, ai_analysis in zip(file_analyses, ai_analyses):
+                file_analysis.ai_analysis = ai_analysis
 
-        # Modernize the code
-        modernized_content = self.java_modernizer.modernize_java_code(content, os.path.basename(file_path))
+        return file_analyses
 
-        # Write modernized file
-        relative_path = os.path.relpath(file_path, project_path)
-        new_file_path = os.path.join(output_path, relative_path)
-        os.makedirs(os.path.dirname(new_file_path), exist_ok=True)
+    def _analyze_build_files(self, project_path: str, project_analysis: ProjectAnalysis) -> Dict[str, bytes]:
+        """
+        Analyze Maven pom.xml or Gradle build.gradle
         
-        with open(new_file_path, "w", encoding="utf-8") as f:
-            f.write(modernized_content)
-
-        # Create analysis result
-        file_analysis = FileAnalysis(
-            filename=os.path.basename(file_path),
-            filepath=relative_path,
-            issues=analysis["issues"],
-            suggestions=analysis["suggestions"],
-            transformations=analysis["transformations"],
-            ai_analysis=ai_analysis
-        )
-
-        return file_analysis
-
-    def _analyze_build_files(self, project_path: str, project_analysis: ProjectAnalysis) -> None:
-        """Analyze Maven pom.xml or Gradle build.gradle"""
+        Returns: raw content of the build files read, by path, so the copy
+        step can update them without reading them again
+        """
+        build_files = {}
+        # One listing answers every "is it there?" below instead of a stat each
+        root_files = _file_names(project_path)
         
         # Check for pom.xml
         pom_path = os.path.join(project_path, "pom.xml")
-        if os.path.exists(pom_path):
-            with open(pom_path, "r", encoding="utf-8", errors="ignore") as f:
+        if "pom.xml" in root_files:
+            # Build files are only pattern-matched, never rewritten here, so
+            # both analyzers work on the raw bytes without a decode
+            with open(pom_path, "rb") as f:
                 pom_content = f.read()
+            build_files[pom_path] = pom_content
             
             pom_analysis = self.java_modernizer.analyze_pom_xml(pom_content)
             project_analysis.build_file_type = "maven"
@@ -273,9 +1110,10 @@ class GenAIService:
 
         # Check for build.gradle
         gradle_path = os.path.join(project_path, "build.gradle")
-        if os.path.exists(gradle_path):
-            with open(gradle_path, "r", encoding="utf-8", errors="ignore") as f:
+        if "build.gradle" in root_files:
+            with open(gradle_path, "rb") as f:
                 gradle_content = f.read()
+            build_files[gradle_path] = gradle_content
             
             gradle_analysis = self.java_modernizer.analyze_build_gradle(gradle_content)
             project_analysis.build_file_type = "gradle"
@@ -287,58 +1125,71 @@ class GenAIService:
             gradle_config = config_analyzer.analyze_gradle_properties(gradle_content)
             project_analysis.dependency_issues.extend(gradle_config.get("issues", []))
         
-        # Analyze application.properties
-        app_properties_path = os.path.join(project_path, "src/main/resources/application.properties")
-        if os.path.exists(app_properties_path):
-            props_analysis = config_analyzer.analyze_config_file(app_properties_path)
-            if props_analysis:
-                project_analysis.dependency_issues.extend(props_analysis.get("issues", []))
-                project_analysis.build_recommendations.extend(props_analysis.get("recommendations", []))
+        # Analyze application.properties and application.yml/yaml together
+        resources_dir = os.path.join(project_path, "src/main/resources")
+        resource_files = _file_names(resources_dir)
+        config_paths = [
+            os.path.join(resources_dir, config_file)
+            for config_file in ["application.properties", "application.yml", "application.yaml"]
+            if config_file in resource_files
+        ]
+        for config_analysis in config_analyzer.analyze_config_files(config_paths):
+            if config_analysis:
+                project_analysis.dependency_issues.extend(config_analysis.get("issues", []))
+                project_analysis.build_recommendations.extend(config_analysis.get("recommendations", []))
         
-        # Analyze application.yml/yaml
-        for yml_file in ["application.yml", "application.yaml"]:
-            app_yml_path = os.path.join(project_path, f"src/main/resources/{yml_file}")
-            if os.path.exists(app_yml_path):
-                yml_analysis = config_analyzer.analyze_config_file(app_yml_path)
-                if yml_analysis:
-                    project_analysis.dependency_issues.extend(yml_analysis.get("issues", []))
-                    project_analysis.build_recommendations.extend(yml_analysis.get("recommendations", []))
-
-    def _copy_non_java_files(self, project_path: str, output_path: str) -> None:
-        """Copy non-Java files to maintain project structure and update build files"""
-        for root, dirs, files in os.walk(project_path):
-            # Skip output directories
-            dirs[:] = [d for d in dirs if not d.endswith("_modernized")]
-            
-            for file in files:
-                if not file.endswith(".java"):
-                    src_file = os.path.join(root, file)
-                    rel_path = os.path.relpath(src_file, project_path)
-                    dst_file = os.path.join(output_path, rel_path)
-                    
-                    os.makedirs(os.path.dirname(dst_file), exist_ok=True)
-                    try:
-                        shutil.copy2(src_file, dst_file)
-                    except Exception as e:
-                        logger.warning(f"Could not copy {src_file}: {str(e)}")
+        return build_files
+
+    def _copy_non_java_files(
+        self,
+        project_path: str,
+        output_path: str,
+        build_files: Optional[Dict[str, bytes]] = None
+    ) -> None:
+        """
+        Copy non-Java files to maintain project structure and update build files
         
-        # Update pom.xml after copying
-        pom_path = os.path.join(output_path, "pom.xml")
-        if os.path.exists(pom_path):
-            success, message, changes = pom_updater.update_pom_xml(pom_path)
-            if success and len(changes) > 0:
-                logger.info(f"Updated pom.xml: {len(changes)} changes")
-            else:
-                logger.info("No pom.xml updates needed")
+        The root pom.xml and build.gradle are not copied: their updaters write
+        the modernized file straight into output_path, from the content
+        _analyze_build_files already read when it is passed in build_files.
+        """
+        build_files = build_files or {}
+        build_sources = {
+            os.path.join(project_path, "pom.xml"): pom_updater.update_pom_xml,
+            os.path.join(project_path, "build.gradle"): gradle_updater.update_build_gradle,
+        }
+        _, other_files = _walk_project(project_path)
+        other_files = [src_file for src_file in other_files if src_file not in build_sources]
+        dst_files = [
+            os.path.join(output_path, os.path.relpath(src_file, project_path))
+            for src_file in other_files
+        ]
+        
+        # Create each target directory once, then copy; copies are I/O-bound
+        # and independent, so they share the I/O pool
+        os.makedirs(output_path, exist_ok=True)
+        for dst_dir in {os.path.dirname(dst_file) for dst_file in dst_files}:
+            os.makedirs(dst_dir, exist_ok=True)
+        if len(other_files) < 2 or (os.cpu_count() or 1) < 2:
+            for src_file, dst_file in zip(other_files, dst_files):
+                _copy_file(src_file, dst_file)
+        else:
+            list(_io_pool().map(_copy_file, other_files, dst_files))
         
-        # Update build.gradle after copying
-        gradle_path = os.path.join(output_path, "build.gradle")
-        if os.path.exists(gradle_path):
-            success, message, changes = gradle_updater.update_build_gradle(gradle_path)
+        # Update pom.xml and build.gradle into the output
+        for src_file, update in build_sources.items():
+            if src_file not in build_files and not os.path.isfile(src_file):
+                continue
+            build_file = os.path.basename(src_file)
+            dst_file = os.path.join(output_path, build_file)
+            success, message, changes = update(src_file, build_files.get(src_file), output_path=dst_file)
+            if not success:
+                # Still ship the original, as a plain copy would have
+                _copy_file(src_file, dst_file)
             if success and len(changes) > 0:
-                logger.info(f"Updated build.gradle: {len(changes)} changes")
+                logger.info(f"Updated {build_file}: {len(changes)} changes")
             else:
-                logger.info("No build.gradle updates needed")
+                logger.info(f"No {build_file} updates needed")
 
 
 genai_service = GenAIService()
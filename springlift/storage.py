@@ -1,14 +1,95 @@
-from typing import Dict
+"""
+Scan Result Storage
+Keeps recent scan results in a bounded, thread-safe in-memory LRU, optionally
+backed by SQLite so results survive restarts and eviction
+"""
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Optional
 from .models import ScanResult
+from .logger import logger
 
-# In-memory storage for scan results
-_scan_results: Dict[str, ScanResult] = {}
+# Most scan results held in memory; the least recently used are evicted first
+_MAX_SCAN_RESULTS = 1024
 
-def save_scan_result(result: ScanResult):
+# Set SPRINGLIFT_SCAN_DB to a file path to keep every result on disk as well
+_SCAN_DB_PATH = os.path.expanduser(os.environ.get("SPRINGLIFT_SCAN_DB", ""))
+
+# In-memory storage for scan results, most recently used last
+_scan_results: "OrderedDict[str, ScanResult]" = OrderedDict()
+_lock = threading.RLock()
+
+_connection: Optional[sqlite3.Connection] = None
+_db_disabled = not _SCAN_DB_PATH
+
+def _connect() -> Optional[sqlite3.Connection]:
+    """Open the scan database on first use; callers hold _lock"""
+    global _connection, _db_disabled
+    if _connection is None and not _db_disabled:
+        try:
+            os.makedirs(os.path.dirname(_SCAN_DB_PATH) or ".", exist_ok=True)
+            connection = sqlite3.connect(_SCAN_DB_PATH, check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS scan_results (id TEXT PRIMARY KEY, result TEXT NOT NULL)"
+            )
+            connection.commit()
+            _connection = connection
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Scan result database disabled ({_SCAN_DB_PATH}): {str(e)}")
+            _db_disabled = True
+    return _connection
+
+def _remember(result: ScanResult) -> None:
+    """Put result in the in-memory LRU, evicting the oldest; callers hold _lock"""
     _scan_results[result.id] = result
+    _scan_results.move_to_end(result.id)
+    if len(_scan_results) > _MAX_SCAN_RESULTS:
+        _scan_results.popitem(last=False)
+
+def save_scan_result(result: ScanResult):
+    with _lock:
+        _remember(result)
+        connection = _connect()
+        if connection is None:
+            return
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO scan_results (id, result) VALUES (?, ?)",
+                (result.id, result.model_dump_json())
+            )
+            connection.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not persist scan result {result.id}: {str(e)}")
 
 def get_scan_result(scan_id: str) -> ScanResult:
-    return _scan_results.get(scan_id)
+    with _lock:
+        result = _scan_results.get(scan_id)
+        if result is not None:
+            _scan_results.move_to_end(scan_id)
+            return result
+        connection = _connect()
+        if connection is None:
+            return None
+        try:
+            row = connection.execute("SELECT result FROM scan_results WHERE id = ?", (scan_id,)).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Scan result lookup failed for {scan_id}: {str(e)}")
+            return None
+        if row is None:
+            return None
+        result = ScanResult.model_validate_json(row[0])
+        _remember(result)
+        return result
 
 def clear_storage():
-    _scan_results.clear()
+    with _lock:
+        _scan_results.clear()
+        connection = _connect()
+        if connection is not None:
+            try:
+                connection.execute("DELETE FROM scan_results")
+                connection.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Could not clear scan result database: {str(e)}")
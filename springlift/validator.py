@@ -5,9 +5,21 @@ Validates and sanitizes user inputs for security and reliability
 import os
 import re
 from pathlib import Path
-from typing import Tuple
+from typing import Iterator, Tuple
 from .logger import logger
 
+# Directory names never searched for Java sources: caches, dependencies and
+# Maven/Gradle build output, which can be large and only holds generated code
+_EXCLUDED_DIRS = frozenset(['__pycache__', 'node_modules', 'target', 'build'])
+
+# UUID format: xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx
+_UUID_RE = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
+
+# sanitize_filename: reserved characters become '_', control characters are dropped
+_FILENAME_TABLE = {ord(c): '_' for c in '<>:"/\\|?*'}
+_FILENAME_TABLE.update(dict.fromkeys(range(0x20)))
+_DOT_RUN_RE = re.compile(r'\.{2,}')
+
 
 class InputValidator:
     """
@@ -24,6 +36,9 @@ class InputValidator:
         r'[\x00-\x1f]',    # Control characters
     ]
     
+    # All of the above in one pass; group n is DANGEROUS_PATTERNS[n - 1]
+    _DANGER_RE = re.compile('|'.join(f'({pattern})' for pattern in DANGEROUS_PATTERNS))
+    
     @staticmethod
     def validate_project_path(project_path: str) -> Tuple[bool, str]:
         """
@@ -46,9 +61,10 @@ class InputValidator:
             return False, f"Project path exceeds maximum length of {InputValidator.MAX_PATH_LENGTH} characters"
         
         # 3. Check for dangerous patterns
-        for pattern in InputValidator.DANGEROUS_PATTERNS:
-            if re.search(pattern, project_path):
-                return False, f"Project path contains invalid characters or patterns: {pattern}"
+        match = InputValidator._DANGER_RE.search(project_path)
+        if match:
+            pattern = InputValidator.DANGEROUS_PATTERNS[match.lastindex - 1]
+            return False, f"Project path contains invalid characters or patterns: {pattern}"
         
         # 4. Normalize and check for path traversal
         try:
@@ -77,8 +93,8 @@ class InputValidator:
             return False, f"No read permission for project path: {normalized}"
         
         # 9. Check for Java files (must have at least one)
-        java_files = InputValidator._find_java_files(normalized)
-        if not java_files:
+        # Only existence matters, so stop at the first file found
+        if next(InputValidator._iter_java_files(normalized), None) is None:
             logger.warning(f"No Java files found in project path: {normalized}")
             # Note: We allow this but log warning
         
@@ -115,10 +131,7 @@ class InputValidator:
         if not scan_id or not isinstance(scan_id, str):
             return False, "Scan ID cannot be empty"
         
-        # UUID format: xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx
-        uuid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-        
-        if not re.match(uuid_pattern, scan_id.lower()):
+        if not _UUID_RE.match(scan_id):
             return False, f"Invalid scan ID format: {scan_id}"
         
         return True, ""
@@ -132,9 +145,8 @@ class InputValidator:
         """
         
         # Remove or replace dangerous characters
-        filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-        filename = re.sub(r'[\x00-\x1f]', '', filename)
-        filename = re.sub(r'\.{2,}', '_', filename)  # Replace multiple dots
+        filename = filename.translate(_FILENAME_TABLE)
+        filename = _DOT_RUN_RE.sub('_', filename)  # Replace multiple dots
         
         # Remove leading/trailing spaces and dots
         filename = filename.strip(' .')
@@ -181,21 +193,35 @@ class InputValidator:
         
         Returns: list of .java file paths
         """
-        java_files = []
+        return list(InputValidator._iter_java_files(directory))
+    
+    @staticmethod
+    def _iter_java_files(directory: str) -> Iterator[str]:
+        """
+        Yield Java files under directory as they are found
         
-        try:
-            for root, dirs, files in os.walk(directory):
-                # Skip hidden directories and common exclusions
-                dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['__pycache__', 'node_modules']]
-                
-                for file in files:
-                    if file.endswith('.java'):
-                        java_files.append(os.path.join(root, file))
-        except (OSError, PermissionError) as e:
-            logger.warning(f"Could not search directory {directory}: {str(e)}")
-        
-        return java_files
-
+        Walks with an explicit stack of os.scandir listings, so the type of
+        each entry comes from the directory read itself and paths are built
+        by scandir rather than os.path.join. Symlinked directories are not
+        descended into, as with os.walk.
+        
+        Returns: iterator of .java file paths
+        """
+        stack = [directory]
+        while stack:
+            path = stack.pop()
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if entry.is_dir():
+                            # Skip hidden directories and common exclusions
+                            if not (name.startswith('.') or name in _EXCLUDED_DIRS or entry.is_symlink()):
+                                stack.append(entry.path)
+                        elif name.endswith('.java'):
+                            yield entry.path
+            except OSError as e:
+                logger.warning(f"Could not search directory {path}: {str(e)}")
 
 # Request validation decorator
 def validate_request(request):
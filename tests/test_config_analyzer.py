@@ -0,0 +1,77 @@
+from springlift.config_analyzer import ConfigurationAnalyzer
+import io
+import os
+import tempfile
+
+PROPERTIES = """# comment
+spring.jpa.properties.hibernate.dialect=org.hibernate.dialect.H2Dialect
+spring.datasource.hikari.maximum-pool-size = 10
+java.version=1.8
+myapp.key=value
+"""
+
+def test_properties_analysis():
+    result = ConfigurationAnalyzer.analyze_application_properties(PROPERTIES)
+    assert result["migrations"] == {"spring.jpa.properties.hibernate.dialect": "spring.jpa.database-platform"}
+    assert [issue["line"] for issue in result["issues"]] == [3]
+    assert result["issues"][0]["property"] == "spring.datasource.hikari.maximum-pool-size"
+    assert {r["property"] for r in result["recommendations"]} == {
+        "spring.jpa.properties.hibernate.dialect",
+        "java.version",
+    }
+
+def test_properties_analysis_streamed_matches_string():
+    streamed = ConfigurationAnalyzer.analyze_application_properties(io.StringIO(PROPERTIES))
+    assert streamed == ConfigurationAnalyzer.analyze_application_properties(PROPERTIES)
+
+def test_yaml_analysis_uses_nested_keys():
+    content = "spring:\n  datasource:\n    hikari:\n      maximum-pool-size: 5\nother:\n  maximum-pool-size: 5\n"
+    result = ConfigurationAnalyzer.analyze_application_yaml(content)
+    assert len(result["issues"]) == 1
+    assert result["issues"][0]["line"] == 4
+
+def test_pom_properties_with_dotted_names():
+    content = (
+        '<project xmlns="http://maven.apache.org/POM/4.0.0"><properties>'
+        '<java.version>11</java.version><spring.boot.version>2.7.5</spring.boot.version>'
+        '</properties></project>'
+    )
+    result = ConfigurationAnalyzer.analyze_pom_xml_properties(content)
+    assert result["properties"] == {"java.version": "11", "spring.boot.version": "2.7.5"}
+    assert len(result["recommendations"]) == 2
+
+def test_analyze_config_file_build_files():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        gradle_path = os.path.join(tmpdir, "build.gradle")
+        with open(gradle_path, "w") as f:
+            f.write("sourceCompatibility = '1.8'\n")
+
+        result = ConfigurationAnalyzer.analyze_config_file(gradle_path)
+        assert result["config"] == {"sourceCompatibility": "1.8"}
+        assert ConfigurationAnalyzer.analyze_config_files([gradle_path]) == [result]
+
+def test_analyze_config_file_returns_private_copies():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        properties_path = os.path.join(tmpdir, "application.properties")
+        with open(properties_path, "w") as f:
+            f.write(PROPERTIES)
+
+        result = ConfigurationAnalyzer.analyze_config_file(properties_path)
+        result["issues"].append({"line": 0})
+        result["recommendations"].clear()
+        assert ConfigurationAnalyzer.analyze_config_file(properties_path) == \
+            ConfigurationAnalyzer.analyze_application_properties(PROPERTIES)
+
+def test_analyze_config_file_does_not_cache_failures():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        properties_path = os.path.join(tmpdir, "application.properties")
+        with open(properties_path, "wb") as f:
+            f.write(b"server.port=\xff\n")
+        st = os.stat(properties_path)
+        assert ConfigurationAnalyzer.analyze_config_file(properties_path) is None
+
+        # Same size and mtime, so only an uncached failure lets this through
+        with open(properties_path, "wb") as f:
+            f.write(b"server.port=8\n")
+        os.utime(properties_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert ConfigurationAnalyzer.analyze_config_file(properties_path) is not None
@@ -0,0 +1,46 @@
+from springlift.diff_report import DiffReportGenerator, _lcs_similarity
+import difflib
+
+ORIGINAL = "package a;\nimport javax.persistence.Entity;\n\npublic class A {\n    @Deprecated\n    void f() {}\n}\n"
+MODERNIZED = "package a;\nimport jakarta.persistence.Entity;\n\npublic class A {\n    void f() {}\n}\n"
+
+def test_generate_file_diff_sections():
+    result = DiffReportGenerator.generate_file_diff(ORIGINAL, MODERNIZED, "A.java")
+    assert (result["added_lines"], result["removed_lines"]) == (1, 2)
+    assert [s["change_type"] for s in result["changed_sections"]] == ["namespace_migration", "deprecated_removed"]
+    assert result["unified_diff"] == "".join(difflib.unified_diff(
+        ORIGINAL.splitlines(keepends=True),
+        MODERNIZED.splitlines(keepends=True),
+        fromfile="original/A.java",
+        tofile="modernized/A.java",
+        lineterm=""
+    ))
+
+def test_lcs_similarity_matches_lcs_definition():
+    # LCS("ABCBDAB", "BDCABA") has length 4
+    assert _lcs_similarity("ABCBDAB", "BDCABA") == 2 * 4 / 13
+    assert _lcs_similarity("", "") == 1.0
+    assert _lcs_similarity("abc", "") == 0.0
+
+def test_count_lines_matches_splitlines():
+    for content in ["", "a", "a\n", "a\nb", "a\r\nb\r\n", "a\rb", "a\r", "\n\n", "a\r\n\rb", "a\x0cb c\n"]:
+        assert DiffReportGenerator._count_lines(content) == len(content.splitlines()), repr(content)
+
+def test_generate_file_diff_returns_private_sections():
+    first = DiffReportGenerator.generate_file_diff(ORIGINAL, MODERNIZED, "A.java")
+    first["changed_sections"][0]["change_type"] = "mutated"
+    first["changed_sections"].clear()
+    second = DiffReportGenerator.generate_file_diff(ORIGINAL, MODERNIZED, "B.java")
+    assert [s["change_type"] for s in second["changed_sections"]] == ["namespace_migration", "deprecated_removed"]
+
+def test_generate_file_diffs_parallel_matches_single_diffs():
+    triples = [(ORIGINAL, MODERNIZED, "A.java"), (ORIGINAL, ORIGINAL, "B.java"), (MODERNIZED, ORIGINAL, "C.java")]
+    expected = [DiffReportGenerator.generate_file_diff(*triple) for triple in triples]
+    assert DiffReportGenerator.generate_file_diffs_parallel(triples, max_workers=2) == expected
+    assert DiffReportGenerator.generate_file_diffs_parallel(triples, max_workers=1) == expected
+
+def test_generate_file_stats_matches_file_diff_stats():
+    for original, modernized in [(ORIGINAL, MODERNIZED), (ORIGINAL, ORIGINAL), ("a\nb", "")]:
+        diff = DiffReportGenerator.generate_file_diff(original, modernized, "A.java")
+        stats = DiffReportGenerator.generate_file_stats(original, modernized, "A.java")
+        assert stats == {key: diff[key] for key in stats}
@@ -0,0 +1,57 @@
+from springlift.gradle_updater import GradleUpdater
+import os
+import tempfile
+
+BUILD_GRADLE = """plugins {
+    id 'org.springframework.boot' version '2.7.5'
+}
+sourceCompatibility = '1.8'
+dependencies {
+    implementation 'org.springframework:spring-core:5.3.1'
+    implementation "org.slf4j:slf4j-api:1.7.30"
+    implementation 'com.example:lib:1.0'
+}
+"""
+
+def test_update_build_gradle_dependencies():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        gradle_path = os.path.join(tmpdir, "build.gradle")
+        with open(gradle_path, "w") as f:
+            f.write(BUILD_GRADLE)
+
+        success, _, changes = GradleUpdater().update_build_gradle(gradle_path)
+        assert success
+        assert "Updated spring-core to 6.1.0" in changes
+        assert "Updated slf4j-api to 2.0.7" in changes
+
+        with open(gradle_path) as f:
+            content = f.read()
+        assert "'org.springframework:spring-core:6.1.0'" in content
+        assert '"org.slf4j:slf4j-api:2.0.7"' in content
+        assert "'com.example:lib:1.0'" in content
+
+def test_get_gradle_info_returns_private_copies():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        gradle_path = os.path.join(tmpdir, "build.gradle")
+        with open(gradle_path, "w") as f:
+            f.write(BUILD_GRADLE)
+
+        updater = GradleUpdater()
+        info = updater.get_gradle_info(gradle_path)
+        info["dependencies"].append("mutated")
+        info["current_java_version"] = "mutated"
+        assert updater.get_gradle_info(gradle_path) == updater._parse_gradle_info(BUILD_GRADLE)
+
+def test_unchanged_build_gradle_is_copied_to_output_path():
+    current = b"plugins {\r\n    id 'java'\r\n}\r\n"
+    with tempfile.TemporaryDirectory() as tmpdir:
+        gradle_path = os.path.join(tmpdir, "build.gradle")
+        output_path = os.path.join(tmpdir, "out.gradle")
+        with open(gradle_path, "wb") as f:
+            f.write(current)
+
+        success, _, changes, _ = GradleUpdater().update_build_gradle_with_info(gradle_path, output_path=output_path)
+        assert success and changes == []
+        with open(output_path, "rb") as f:
+            assert f.read() == current
+        assert sorted(os.listdir(tmpdir)) == ["build.gradle", "out.gradle"]
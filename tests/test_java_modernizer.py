@@ -0,0 +1,21 @@
+from springlift.java_modernizer import JavaModernizer
+import os
+import tempfile
+
+SOURCE = """import javax.persistence.Entity;
+public class Order {
+    private final String id;
+    void f() { if (id != null) { } }
+}
+"""
+
+def test_analyze_java_path_matches_string():
+    modernizer = JavaModernizer()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "Order.java")
+        with open(path, "w") as f:
+            f.write(SOURCE)
+
+        result = modernizer.analyze_java_path(path)
+        assert result == modernizer.analyze_java_file(SOURCE, "Order.java")
+        assert result["transformations"]["pojo_to_records"]["classes"] == ["Order"]
@@ -1,6 +1,7 @@
 from fastapi.testclient import TestClient
 from springlift.main import app
-from springlift.storage import clear_storage
+from springlift.storage import clear_storage, save_scan_result
+from springlift.models import ScanRequest, ScanResult
 import pytest
 import tempfile
 import os
@@ -78,7 +79,38 @@ def test_get_scan_result():
         assert data["request"]["project_path"] == project_path
         assert "output_path" in data
 
+def test_scan_async_returns_pending_then_completes():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        project_path = os.path.join(tmpdir, "my-java-project")
+        os.makedirs(project_path)
+        with open(os.path.join(project_path, "App.java"), "w") as f:
+            f.write("public class App {}\n")
+
+        post_response = client.post("/scan/async", json={"project_path": project_path, "use_ai": False})
+        assert post_response.status_code == 202
+        assert post_response.json()["status"] == "pending"
+        scan_id = post_response.json()["id"]
+
+        # The test client runs background tasks before returning
+        get_response = client.get(f"/scan/{scan_id}")
+        assert get_response.status_code == 200
+        assert get_response.json()["status"] == "completed"
+        assert get_response.json()["request"]["project_path"] == project_path
+
 def test_get_scan_not_found():
     response = client.get("/scan/non_existent_id")
     assert response.status_code == 404
     assert response.json() == {"detail": "Scan with ID 'non_existent_id' not found."}
+
+def test_get_scan_not_modified():
+    result = ScanResult(request=ScanRequest(project_path="/tmp/project"), output_path="/tmp/project_modernized")
+    save_scan_result(result)
+
+    response = client.get(f"/scan/{result.id}")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "private, max-age=31536000, immutable"
+
+    cached = client.get(f"/scan/{result.id}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
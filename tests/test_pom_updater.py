@@ -0,0 +1,55 @@
+from springlift.pom_updater import PomUpdater
+import os
+import tempfile
+
+POM_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+    <parent>
+        <groupId>org.springframework.boot</groupId>
+        <artifactId>spring-boot-starter-parent</artifactId>
+        <version>2.7.5</version>
+    </parent>
+    <artifactId>demo</artifactId>
+    <properties>
+        <java.version>1.8</java.version>
+    </properties>
+</project>
+"""
+
+def test_update_pom_xml_updates_parent_once():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pom_path = os.path.join(tmpdir, "pom.xml")
+        with open(pom_path, "w") as f:
+            f.write(POM_XML)
+
+        success, _, changes = PomUpdater().update_pom_xml(pom_path)
+        assert success
+        assert changes.count("Updated parent spring-boot-starter-parent version to 3.2.0") == 1
+        assert "Updated java.version to 21" in changes
+
+        with open(pom_path) as f:
+            content = f.read()
+        assert "<version>3.2.0</version>" in content
+        assert "<java.version>21</java.version>" in content
+
+def test_update_many_matches_single_updates():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pom_paths = []
+        for name in ("a", "b", "c"):
+            os.makedirs(os.path.join(tmpdir, name))
+            pom_path = os.path.join(tmpdir, name, "pom.xml")
+            with open(pom_path, "w") as f:
+                f.write(POM_XML)
+            pom_paths.append(pom_path)
+
+        single_path = os.path.join(tmpdir, "single.xml")
+        with open(single_path, "w") as f:
+            f.write(POM_XML)
+        expected = PomUpdater().update_pom_xml(single_path)
+
+        results = PomUpdater().update_many(pom_paths, max_workers=2)
+        assert [(success, changes) for success, _, changes in results] == [(expected[0], expected[2])] * 3
+        assert "Updated java.version to 21" in expected[2]
+        for pom_path in pom_paths:
+            with open(pom_path) as f, open(single_path) as g:
+                assert f.read() == g.read()
@@ -0,0 +1,100 @@
+from springlift.report_generator import HTMLReportGenerator
+import gzip
+import os
+import re
+import tempfile
+
+def test_full_report_escapes_values():
+    result = {
+        "id": "scan<1>",
+        "project_analysis": {
+            "file_analyses": [{"filename": "A<B>.java", "issues": ["x"]}],
+            "build_recommendations": ["Use \"jakarta\" & 'records'"],
+        },
+    }
+    with tempfile.TemporaryDirectory() as tmpdir:
+        assert HTMLReportGenerator.generate_full_report(result, tmpdir)
+        with open(os.path.join(tmpdir, "modernization_report.html"), encoding="utf-8") as f:
+            html = f.read()
+    assert "scan&lt;1&gt;" in html
+    assert "A&lt;B&gt;.java" in html
+    assert "Use &quot;jakarta&quot; &amp; &#39;records&#39;" in html
+    assert "<B>" not in html
+
+def test_full_report_compressed_matches_plain():
+    result = {"id": "scan-1", "project_analysis": {"total_files_analyzed": 3}}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        assert HTMLReportGenerator.generate_full_report(result, tmpdir)
+        assert HTMLReportGenerator.generate_full_report(result, tmpdir, compress=True)
+        with open(os.path.join(tmpdir, "modernization_report.html"), "rb") as f:
+            plain = f.read()
+        with gzip.open(os.path.join(tmpdir, "modernization_report.html.gz"), "rb") as f:
+            unpacked = f.read()
+    strip = lambda data: re.sub(rb"Report generated on [^<]*", b"", data)
+    assert strip(unpacked) == strip(plain)
+
+def test_full_report_skips_unchanged_rewrite():
+    result = {"id": "scan-1", "project_analysis": {"total_files_analyzed": 3}}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        report_path = os.path.join(tmpdir, "modernization_report.html")
+        assert HTMLReportGenerator.generate_full_report(result, tmpdir, skip_unchanged=True)
+        os.utime(report_path, (0, 0))
+        assert HTMLReportGenerator.generate_full_report(result, tmpdir, skip_unchanged=True)
+        assert os.stat(report_path).st_mtime == 0
+
+        result["project_analysis"]["total_files_analyzed"] = 4
+        assert HTMLReportGenerator.generate_full_report(result, tmpdir, skip_unchanged=True)
+        assert os.stat(report_path).st_mtime != 0
+        assert sorted(os.listdir(tmpdir)) == [".modernization_report.html.hash", "modernization_report.html"]
+
+def test_full_report_writes_no_sidecar_by_default():
+    result = {"id": "scan-1", "project_analysis": {"total_files_analyzed": 3}}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        report_path = os.path.join(tmpdir, "modernization_report.html")
+        assert HTMLReportGenerator.generate_full_report(result, tmpdir)
+        os.utime(report_path, (0, 0))
+        assert HTMLReportGenerator.generate_full_report(result, tmpdir)
+        assert os.stat(report_path).st_mtime != 0
+        assert os.listdir(tmpdir) == ["modernization_report.html"]
+
+def test_full_report_accepts_generators():
+    result = {
+        "project_analysis": {
+            "file_analyses": ({"filename": f"F{i}.java"} for i in range(12)),
+            "build_recommendations": (f"Rec {i}" for i in range(7)),
+            "dependency_upgrades": iter([("spring-core", "6.1.0")]),
+        },
+    }
+    with tempfile.TemporaryDirectory() as tmpdir:
+        assert HTMLReportGenerator.generate_full_report(result, tmpdir)
+        with open(os.path.join(tmpdir, "modernization_report.html"), encoding="utf-8") as f:
+            html = f.read()
+    assert "F9.java" in html and "F10.java" not in html
+    assert "... and 2 more files" in html
+    assert "... and 2 more recommendations" in html
+    assert "spring-core" in html
+
+def test_generate_many_matches_single_reports():
+    results = [{"id": f"scan-{i}", "project_analysis": {"total_files_analyzed": i}} for i in range(3)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        dirs = [os.path.join(tmpdir, str(i)) for i in range(3)]
+        assert HTMLReportGenerator.generate_many(zip(results, dirs)) == [True] * 3
+        for i, output_dir in enumerate(dirs):
+            with open(os.path.join(output_dir, "modernization_report.html"), encoding="utf-8") as f:
+                assert f"scan-{i}" in f.read()
+
+def test_full_report_from_scan_result_dump():
+    from springlift.models import FileAnalysis, ProjectAnalysis, ScanRequest, ScanResult
+    result = ScanResult(
+        request=ScanRequest(project_path="/project"),
+        output_path="/project_modernized",
+        project_analysis=ProjectAnalysis(
+            file_analyses=[FileAnalysis(filename="Legacy.java", filepath="Legacy.java", issues=["x"])]
+        ),
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        assert HTMLReportGenerator.generate_full_report(result.model_dump(mode="json"), tmpdir)
+        with open(os.path.join(tmpdir, "modernization_report.html"), encoding="utf-8") as f:
+            html = f.read()
+    assert result.id in html
+    assert "Legacy.java" in html
@@ -34,3 +34,68 @@ def test_dockerfile_suggestion_java():
     suggestion = service._suggest_dockerfile(request)
     assert "openjdk:17-jdk-slim" in suggestion.suggested_code
     assert "java -jar" in suggestion.suggested_code
+
+def test_packed_ai_answers_are_cached_under_the_packed_request(monkeypatch, tmp_path):
+    import json
+    import re
+    import sys
+    import types
+    from springlift import services
+
+    sent = []
+
+    class FakeCompletions:
+        async def create(self, **request):
+            prompt = request["messages"][1]["content"]
+            sent.append(prompt)
+            numbers = re.findall(r"### File (\d+)", prompt)
+            if not numbers:
+                return types.SimpleNamespace(choices=[types.SimpleNamespace(
+                    message=types.SimpleNamespace(content='{"critical_issues": ["single"]}'))])
+            answer = json.dumps({number: {"critical_issues": ["packed"]} for number in numbers})
+            return types.SimpleNamespace(choices=[types.SimpleNamespace(message=types.SimpleNamespace(content=answer))])
+
+    class FakeAsyncOpenAI:
+        def __init__(self, **kwargs):
+            self.chat = types.SimpleNamespace(completions=FakeCompletions())
+
+        async def close(self):
+            pass
+
+    monkeypatch.setitem(sys.modules, "openai", types.SimpleNamespace(AsyncOpenAI=FakeAsyncOpenAI))
+    monkeypatch.setattr(services, "_response_cache", services._ResponseCache(str(tmp_path / "cache.sqlite")))
+    llm = services.LLMService()
+    llm.use_openai, llm.openai_api_key = True, "test"
+    files = [(f"class A{i} {{}}", f"A{i}.java") for i in range(3)]
+
+    first = llm.analyze_many_with_ai(files, "openai")
+    assert len(sent) == 1 and all("packed" in answer for answer in first)
+    assert llm.analyze_many_with_ai(files, "openai") == first
+    assert len(sent) == 1
+
+    # A single-file request was never sent for these files, so it is not a cache hit
+    assert "single" in llm.analyze_many_with_ai(files[:1], "openai")[0]
+    assert len(sent) == 2
+
+def test_malformed_env_int_falls_back_to_default(monkeypatch):
+    from springlift import services
+    monkeypatch.setenv("SPRINGLIFT_TEST_LIMIT", "500/min")
+    assert services._env_int("SPRINGLIFT_TEST_LIMIT", 7) == 7
+    monkeypatch.setenv("SPRINGLIFT_TEST_LIMIT", " 42 ")
+    assert services._env_int("SPRINGLIFT_TEST_LIMIT", 7) == 42
+
+def test_response_cache_prunes_old_and_excess_answers(monkeypatch, tmp_path):
+    from springlift import services
+    clock = iter(range(1000, 2000))
+    monkeypatch.setattr(services.time, "time", lambda: next(clock))
+    monkeypatch.setattr(services, "_LLM_CACHE_PRUNE_EVERY", 1)
+    cache = services._ResponseCache(str(tmp_path / "cache.sqlite"), max_rows=2, max_age_days=1)
+    for key in ("a", "b", "c"):
+        cache.put(key, key.upper())
+    assert [cache.get(key) for key in ("a", "b", "c")] == [None, "B", "C"]
+
+    clock = iter(range(1000 + 2 * 24 * 60 * 60, 2000 + 2 * 24 * 60 * 60))
+    assert cache.get("c") is None
+    cache.put("d", "D")
+    assert cache._connection.execute("SELECT key FROM responses").fetchall() == [("d",)]
+    cache._connection.close()
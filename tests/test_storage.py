@@ -0,0 +1,43 @@
+from collections import OrderedDict
+from springlift import storage
+from springlift.models import ScanRequest, ScanResult
+
+def _result(name):
+    return ScanResult(request=ScanRequest(project_path=f"/tmp/{name}"), output_path=f"/tmp/{name}_modernized")
+
+def _use_fresh_storage(monkeypatch, db_path=""):
+    monkeypatch.setattr(storage, "_scan_results", OrderedDict())
+    monkeypatch.setattr(storage, "_SCAN_DB_PATH", db_path)
+    monkeypatch.setattr(storage, "_connection", None)
+    monkeypatch.setattr(storage, "_db_disabled", not db_path)
+
+def test_least_recently_used_result_is_evicted(monkeypatch):
+    _use_fresh_storage(monkeypatch)
+    monkeypatch.setattr(storage, "_MAX_SCAN_RESULTS", 2)
+    first, second, third = _result("a"), _result("b"), _result("c")
+    storage.save_scan_result(first)
+    storage.save_scan_result(second)
+    assert storage.get_scan_result(first.id) is first
+
+    storage.save_scan_result(third)
+    assert storage.get_scan_result(second.id) is None
+    assert storage.get_scan_result(first.id) is first
+    assert storage.get_scan_result(third.id) is third
+
+def test_database_keeps_evicted_results_until_cleared(monkeypatch, tmp_path):
+    _use_fresh_storage(monkeypatch, str(tmp_path / "scans.sqlite"))
+    monkeypatch.setattr(storage, "_MAX_SCAN_RESULTS", 1)
+    try:
+        first, second = _result("a"), _result("b")
+        storage.save_scan_result(first)
+        storage.save_scan_result(second)
+        assert first.id not in storage._scan_results
+
+        restored = storage.get_scan_result(first.id)
+        assert restored == first and restored is not first
+
+        storage.clear_storage()
+        assert storage.get_scan_result(first.id) is None
+        assert storage.get_scan_result(second.id) is None
+    finally:
+        storage._connection.close()